@@ -12,8 +12,8 @@ Features
 * Extracts all API endpoints including DRF ViewSet methods and function-based views
 * Detects HTTP methods from ViewSets, class-based views, and @api_view decorators
 
-Usage
------
+Usage (Python 3.10+)
+--------------------
     python3 django_openapi_spec_creator.py \
         -e /path/to/project/project/urls.py \
         -o openapi.json \
@@ -31,48 +31,93 @@ from __future__ import annotations
 
 import argparse
 import ast
-import importlib.util
+import functools
+import hashlib
+import importlib.machinery
 import json
 import os
+import pickle
 import re
 import sys
+import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Set, Tuple, Optional, Any
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
 from apispec import APISpec
 from apispec.ext.marshmallow import MarshmallowPlugin
 
 
 # ────────────────────────── helper utilities ──────────────────────────
-def _ensure_on_syspath(folder: Path) -> None:
-    """Add *folder* to sys.path once so importlib can resolve includes."""
-    folder_str = str(folder)
-    if folder_str not in sys.path:
-        sys.path.insert(0, folder_str)
+@functools.lru_cache(maxsize=None)
+def _search_paths(project_root: Path) -> Tuple[str, ...]:
+    """Directories searched for included modules, without touching sys.path.
+
+    Common Django app locations come first (``apps/``, the project's parent,
+    the project root), followed by the interpreter's own sys.path.
+    """
+    preferred = [str(project_root / "apps"), str(project_root.parent), str(project_root)]
+    return tuple(dict.fromkeys(preferred + sys.path))
+
+
+def _find_module_spec(mod: str, search_paths: Tuple[str, ...]):
+    """Locate *mod* like importlib.util.find_spec, but without importing its
+    parent packages or mutating sys.path: each package level is looked up with
+    PathFinder in the previous level's ``submodule_search_locations``."""
+    locations: List[str] | None = list(search_paths)
+    spec = None
+    parts = mod.split(".")
+    for depth in range(1, len(parts) + 1):
+        if locations is None:  # parent is a plain module, not a package
+            return None
+        spec = importlib.machinery.PathFinder.find_spec(".".join(parts[:depth]), locations)
+        if spec is None:
+            return None
+        locations = spec.submodule_search_locations
+    return spec
 
 
 def _str(node: ast.AST) -> str | None:
-    if isinstance(node, ast.Str):
-        return node.s
-    if isinstance(node, ast.Constant) and isinstance(node.value, str):
-        return node.value
-    return None
+    # ast.Str is a deprecated alias; string literals are ast.Constant since 3.8
+    return node.value if type(node) is ast.Constant and type(node.value) is str else None
 
 
 def _str_list(node: ast.AST) -> List[str]:
     if isinstance(node, (ast.List, ast.Tuple)):
-        return [_str(el) for el in node.elts if _str(el)]
+        return [s for s in map(_str, node.elts) if s]
     return []
 
 
-_slug = re.compile(r"<(?:int|str|slug|uuid|path):([^>]+)>")
-_angle = re.compile(r"<([^>]+)>")
+def _http_methods(names: List[str]) -> List[str]:
+    """Lower-case and intern HTTP method names read from source literals.
+
+    ``str.lower()`` always allocates; interning makes every later "get"/"post"
+    comparison and dict/set hash against the module constants a pointer check.
+    """
+    return [sys.intern(m.lower()) for m in names]
+
+
+# <conv:name> / <name> (group 1), or an already-braced {name} (group 2), in one scan
+_param_re = re.compile(r"<(?:(?:int|str|slug|uuid|path):)?([^>]+)>|{([^}]+)}")
 
 
 def _django_to_openapi(path: str) -> Tuple[str, List[Dict]]:
-    """Convert Django path syntax to OpenAPI path and collect parameters."""
-    openapi = _slug.sub(r"{\1}", path)
-    openapi = _angle.sub(r"{\1}", openapi)
+    """Convert Django path syntax to OpenAPI path and collect parameters.
+
+    A single substitution both rewrites the angle-bracket parameters and
+    records every parameter name, braced ones included, in path order.
+    """
+    names = []
+
+    def _brace(match):
+        name = match.group(1)
+        if name is None:
+            names.append(match.group(2))
+            return match.group(0)
+        names.append(name)
+        return "{" + name + "}"
+
+    openapi = _param_re.sub(_brace, path)
     params = [
         {
             "name": name,
@@ -80,11 +125,70 @@ def _django_to_openapi(path: str) -> Tuple[str, List[Dict]]:
             "required": True,
             "schema": {"type": "string"},
         }
-        for name in re.findall(r"{([^}]+)}", openapi)
+        for name in names
     ]
     return "/" + openapi.lstrip("/"), params
 
 
+# On-disk AST cache: parsed trees are pickled per (path, mtime, size, python)
+_AST_CACHE_DIR = Path(
+    os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")
+) / "spec_creator" / "ast"
+_AST_CACHE_TAG = "ast-v1"
+
+# A module without any of these byte strings cannot contribute routes
+_URLCONF_MARKERS = (b"urlpatterns", b"router", b"Router", b"api_view")
+
+
+def _ast_cache_load(path: Path, source: bytes | None = None) -> ast.Module:
+    """Parse *path*, reusing a pickled tree from a previous run when unchanged."""
+    st = path.stat()
+    key = hashlib.sha256(
+        repr((str(path), st.st_mtime_ns, st.st_size,
+              tuple(sys.version_info), _AST_CACHE_TAG)).encode()
+    ).hexdigest()
+    cache_file = _AST_CACHE_DIR / f"{key}.pickle"
+    try:
+        return pickle.loads(cache_file.read_bytes())
+    except Exception:
+        pass
+
+    tree = ast.parse(source if source is not None else path.read_bytes())
+    # The cache is best-effort: a read-only home or a tree too deep to pickle
+    # (RecursionError) must not break the scan. The temp file is unique per
+    # writer, so pool threads storing the same key never share it.
+    tmp = None
+    try:
+        payload = pickle.dumps(tree, protocol=5)
+        _AST_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=_AST_CACHE_DIR, suffix=".tmp",
+                                         delete=False) as fh:
+            tmp = fh.name
+            fh.write(payload)
+        os.replace(tmp, cache_file)
+    except Exception:
+        if tmp is not None:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+    return tree
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_urls(path_str: str) -> ast.Module | None:
+    """Parse a urls file once per process and share the tree across prefixes.
+
+    Returns ``None`` without parsing when the raw bytes contain no URL-conf
+    markers at all.
+    """
+    path = Path(path_str)
+    source = path.read_bytes()
+    if not any(marker in source for marker in _URLCONF_MARKERS):
+        return None
+    return _ast_cache_load(path, source)
+
+
 # DRF ViewSet standard actions mapping to HTTP methods
 VIEWSET_ACTION_METHODS = {
     "list": ["get"],
@@ -104,8 +208,18 @@ VIEWSET_BASE_ACTIONS = {
 
 
 # ───────────────────────── AST visitor ─────────────────────────
-class URLVisitor(ast.NodeVisitor):
-    """Walk one urls.py AST tree and collect routes, includes, and router prefixes."""
+class CombinedVisitor:
+    """Walk one urls.py AST once and collect @api_view methods, routes,
+    includes, and router prefixes.
+
+    The walk is iterative: nodes are popped from a flat stack and dispatched
+    by exact type, so uninteresting nodes cost one dict miss instead of a
+    ``NodeVisitor.generic_visit`` recursion.
+
+    urlpatterns and ``router.register()`` handling is queued during the walk
+    and replayed in source order afterwards, so every @api_view in the file is
+    known before patterns are resolved (as with the former separate passes).
+    """
 
     def __init__(self, prefix: str = "") -> None:
         self.prefix = prefix
@@ -113,11 +227,41 @@ class URLVisitor(ast.NodeVisitor):
         self.includes: List[Tuple[str, str]] = []  # (module, new_prefix)
         self.routers: Set[str] = set()             # variable names of routers
         self.router_base: dict[str, List[str]] = {}  # router var -> list[prefix]
-        self.viewset_info: dict[str, Dict] = {}    # var name -> viewset info
-        self.route_patterns: Set[str] = set()      # Keep track of found patterns to avoid duplicates
+        self.api_views: Dict[str, List[str]] = {}  # function name -> methods
+        self.route_patterns: Set[Tuple[str, ...]] = set()  # Keep track of found patterns to avoid duplicates
+        self._deferred: List[Tuple[Callable[[ast.AST], None], ast.AST]] = []
+
+    def visit(self, tree: ast.AST) -> None:
+        """Pre-order walk of *tree* in source order."""
+        dispatch = self._DISPATCH
+        stack = [tree]
+        while stack:
+            node = stack.pop()
+            handler = dispatch.get(type(node))
+            if handler is not None:
+                handler(self, node)
+            children = list(ast.iter_child_nodes(node))
+            children.reverse()
+            stack.extend(children)
+
+    def collect(self, tree: ast.AST) -> None:
+        """Walk *tree* and resolve the queued urlpatterns/register calls."""
+        self.visit(tree)
+        for handler, node in self._deferred:
+            handler(node)
+        self._deferred.clear()
+
+    # ─── handle @api_view decorated functions ─────────────────
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        for decorator in node.decorator_list:
+            if isinstance(decorator, ast.Call) and isinstance(decorator.func, ast.Name):
+                if decorator.func.id == "api_view" and decorator.args:
+                    methods = _str_list(decorator.args[0])
+                    if methods:
+                        self.api_views[node.name] = _http_methods(methods)
 
     # ─── handle assignments ───────────────────────────────────
-    def visit_Assign(self, node: ast.Assign):  # type: ignore[override]
+    def visit_Assign(self, node: ast.Assign):
         # Detect "router = DefaultRouter()" etc.
         if isinstance(node.value, ast.Call) and isinstance(node.value.func, ast.Name):
             if node.value.func.id.endswith("Router"):
@@ -128,91 +272,100 @@ class URLVisitor(ast.NodeVisitor):
 
         # Detect "urlpatterns = [...]"
         if any(isinstance(t, ast.Name) and t.id == "urlpatterns" for t in node.targets):
-            self._consume_iterable(node.value)
-        self.generic_visit(node)
+            self._deferred.append((self._consume_iterable, node.value))
 
     # ─── handle augmented assignments (+=) ────────────────────
-    def visit_AugAssign(self, node: ast.AugAssign):  # type: ignore[override]
+    def visit_AugAssign(self, node: ast.AugAssign):
         if isinstance(node.target, ast.Name) and node.target.id == "urlpatterns":
-            self._consume_iterable(node.value)
-        self.generic_visit(node)
+            self._deferred.append((self._consume_iterable, node.value))
 
     # ─── handle calls: extend, router.register, etc. ──────────
-    def visit_Call(self, node: ast.Call):  # type: ignore[override]
+    def visit_Call(self, node: ast.Call):
+        # Only `<name>.extend(...)` and `<name>.register(...)` are of interest;
+        # bail out on every other call (path(), include(), as_view(), ...)
+        func = node.func
+        if type(func) is not ast.Attribute or type(func.value) is not ast.Name:
+            return
+        attr = func.attr
+
         # urlpatterns.extend([...])
-        if (
-            isinstance(node.func, ast.Attribute)
-            and node.func.attr == "extend"
-            and isinstance(node.func.value, ast.Name)
-            and node.func.value.id == "urlpatterns"
-            and node.args
-        ):
-            self._consume_iterable(node.args[0])
+        if attr == "extend":
+            if func.value.id == "urlpatterns" and node.args:
+                self._deferred.append((self._consume_iterable, node.args[0]))
 
         # router.register("users", UserViewSet, ...)
-        if (
-            isinstance(node.func, ast.Attribute)
-            and node.func.attr == "register"
-            and isinstance(node.func.value, ast.Name)
-            and node.func.value.id in self.routers
-        ):
-            router_var = node.func.value.id
-            if len(node.args) >= 2:
-                prefix = _str(node.args[0]) if node.args else None
-                viewset_var = None
-                viewset_class = None
-                
-                # Get the ViewSet class name if possible
-                if isinstance(node.args[1], ast.Name):
-                    viewset_var = node.args[1].id
-                    viewset_class = viewset_var
-                elif isinstance(node.args[1], ast.Attribute):
-                    viewset_class = node.args[1].attr
+        elif attr == "register":
+            if func.value.id in self.routers:
+                self._deferred.append((self._handle_register, node))
+
+    # node type -> unbound handler, built once at class definition time
+    _DISPATCH: Dict[type, Callable[["CombinedVisitor", ast.AST], None]] = {
+        ast.Assign: visit_Assign,
+        ast.AugAssign: visit_AugAssign,
+        ast.Call: visit_Call,
+        ast.FunctionDef: visit_FunctionDef,
+    }
+
+    # Expand router.register("users", UserViewSet, ...) into routes
+    def _handle_register(self, node: ast.Call) -> None:
+        router_var = node.func.value.id
+        if len(node.args) >= 2:
+            prefix = _str(node.args[0]) if node.args else None
+            viewset_var = None
+            viewset_class = None
+            
+            # Get the ViewSet class name if possible
+            if isinstance(node.args[1], ast.Name):
+                viewset_var = node.args[1].id
+                viewset_class = viewset_var
+            elif isinstance(node.args[1], ast.Attribute):
+                viewset_class = node.args[1].attr
+            
+            # Look for basename kwarg
+            basename = None
+            for kw in node.keywords:
+                if kw.arg == "basename" and _str(kw.value):
+                    basename = _str(kw.value)
+            
+            if prefix is not None:
+                # Determine the base actions this ViewSet might have: DRF base
+                # classes map exactly, project ViewSets assume full CRUD
+                actions = []
+                if viewset_class:
+                    actions = VIEWSET_BASE_ACTIONS.get(viewset_class)
+                    if actions is None:
+                        actions = (
+                            VIEWSET_BASE_ACTIONS["ModelViewSet"]
+                            if viewset_class.endswith("ViewSet") else []
+                        )
                 
-                # Look for basename kwarg
-                basename = None
-                for kw in node.keywords:
-                    if kw.arg == "basename" and _str(kw.value):
-                        basename = _str(kw.value)
+                # If no actions detected from class name, assume it's a custom ViewSet
+                # with at least list and retrieve actions
+                if not actions:
+                    actions = ["list", "retrieve"]
                 
-                if prefix is not None:
-                    # Determine the base actions this ViewSet might have
-                    actions = []
-                    if viewset_class:
-                        for base, base_actions in VIEWSET_BASE_ACTIONS.items():
-                            if base in viewset_class or viewset_class.endswith("ViewSet"):
-                                actions.extend(base_actions)
-                    
-                    # If no actions detected from class name, assume it's a custom ViewSet
-                    # with at least list and retrieve actions
-                    if not actions:
-                        actions = ["list", "retrieve"]
+                # Everything but the path is invariant across router bases
+                op_id_prefix = viewset_class or basename or "viewset"
+                list_actions = [
+                    (VIEWSET_ACTION_METHODS.get(a, ["get"]), f"{op_id_prefix}_{a}", f"{a} {prefix}")
+                    for a in actions if a in ("list", "create")
+                ]
+                detail_actions = [
+                    (VIEWSET_ACTION_METHODS.get(a, ["get"]), f"{op_id_prefix}_{a}", f"{a} {prefix}")
+                    for a in actions if a in ("retrieve", "update", "partial_update", "destroy")
+                ]
+                resource = prefix.rstrip("/") + "/"
+
+                for base in self.router_base.get(router_var, [""]):
+                    # Add list/collection endpoints
+                    list_path = self.prefix + base + resource
+                    for methods, op_id, description in list_actions:
+                        self._add_route(list_path, methods, op_id, description)
                     
-                    for base in self.router_base.get(router_var, [""]):
-                        # Add list/collection endpoints
-                        list_path = self.prefix + base + prefix.rstrip("/") + "/"
-                        for action in [a for a in actions if a in ["list", "create"]]:
-                            op_id = f"{viewset_class or basename or 'viewset'}_{action}"
-                            methods = VIEWSET_ACTION_METHODS.get(action, ["get"])
-                            self._add_route(list_path, methods, op_id, f"{action} {prefix}")
-                        
-                        # Add detail endpoints with ID parameter
-                        detail_path = list_path + "{id}/"
-                        for action in [a for a in actions if a in ["retrieve", "update", "partial_update", "destroy"]]:
-                            op_id = f"{viewset_class or basename or 'viewset'}_{action}"
-                            methods = VIEWSET_ACTION_METHODS.get(action, ["get"])
-                            self._add_route(detail_path, methods, op_id, f"{action} {prefix}")
-        
-        # Check for @api_view decorator
-        if isinstance(node.func, ast.Name) and node.func.id == "api_view":
-            if node.args:
-                methods = _str_list(node.args[0])
-                # Store these methods to be used when the decorated function is used in urlpatterns
-                if hasattr(node, "parent_func") and isinstance(node.parent_func, ast.Name):
-                    func_name = node.parent_func.id
-                    self._store_api_view_methods(func_name, methods)
-        
-        self.generic_visit(node)
+                    # Add detail endpoints with ID parameter
+                    detail_path = list_path + "{id}/"
+                    for methods, op_id, description in detail_actions:
+                        self._add_route(detail_path, methods, op_id, description)
 
     # ─── helper to walk list/tuple urlpattern collections ────
     def _consume_iterable(self, node: ast.AST) -> None:
@@ -221,61 +374,35 @@ class URLVisitor(ast.NodeVisitor):
         for elt in node.elts:
             self._handle_pattern_call(elt)
 
-    # Track methods from @api_view decorator
-    def _store_api_view_methods(self, func_name: str, methods: List[str]) -> None:
-        self.viewset_info[func_name] = {"methods": [m.lower() for m in methods]}
-
     # Analyse single path()/re_path() call
     def _handle_pattern_call(self, node: ast.AST) -> None:
-        if not isinstance(node, ast.Call):
-            return
-        func_name = ""
-        if isinstance(node.func, ast.Name):
-            func_name = node.func.id
-        elif isinstance(node.func, ast.Attribute):
-            func_name = node.func.attr
-        if func_name not in {"path", "re_path"}:
-            return
-
-        # First positional arg – raw Django path pattern
-        if not node.args:
-            return
-        raw_path = _str(node.args[0])
-        if raw_path is None:
-            return
-        full_raw = self.prefix + raw_path
-
-        # include(...) ?
-        if (
-            len(node.args) > 1
-            and isinstance(node.args[1], ast.Call)
-            and isinstance(node.args[1].func, ast.Name)
-            and node.args[1].func.id == "include"
-        ):
-            include_arg = node.args[1].args[0] if node.args[1].args else None
-            # Case A: include("app.urls") – string literal
-            mod = _str(include_arg)
-            if mod:
-                self.includes.append((mod, full_raw))
-                return
-            # Case B: include(router.urls)
-            if (
-                isinstance(include_arg, ast.Attribute)
-                and include_arg.attr == "urls"
-                and isinstance(include_arg.value, ast.Name)
-                and include_arg.value.id in self.routers
+        # path("raw/", view, ...) / re_path(...) with a string-literal first arg
+        match node:
+            case ast.Call(
+                func=ast.Name(id="path" | "re_path") | ast.Attribute(attr="path" | "re_path"),
+                args=[ast.Constant(value=str() as raw_path), *rest],
             ):
-                self.router_base.setdefault(include_arg.value.id, [""]).append(raw_path)
+                pass
+            case _:
                 return
-            return
-
-        # Normal endpoint - check view function/class
-        view_arg = node.args[1] if len(node.args) > 1 else None
-        view_name = None
-        if isinstance(view_arg, ast.Name):
-            view_name = view_arg.id
-        elif isinstance(view_arg, ast.Attribute):
-            view_name = view_arg.attr
+        full_raw = self.prefix + raw_path
+        view_arg = rest[0] if rest else None
+
+        match view_arg:
+            case ast.Call(func=ast.Name(id="include"), args=include_args):
+                match include_args:
+                    # Case A: include("app.urls") – string literal
+                    case [ast.Constant(value=str() as mod), *_] if mod:
+                        self.includes.append((mod, full_raw))
+                    # Case B: include(router.urls)
+                    case [ast.Attribute(attr="urls", value=ast.Name(id=router)), *_] if router in self.routers:
+                        self.router_base.setdefault(router, [""]).append(raw_path)
+                return
+            # Normal endpoint - check view function/class
+            case ast.Name(id=view_name) | ast.Attribute(attr=view_name):
+                pass
+            case _:
+                view_name = None
         
         name_kw = next((kw for kw in node.keywords if kw.arg == "name"), None)
         op_id = _str(name_kw.value) if name_kw else f"op_{len(self.routes)}"
@@ -284,29 +411,26 @@ class URLVisitor(ast.NodeVisitor):
 
         # Check for methods from @api_view decorator
         methods = []
-        if view_name and view_name in self.viewset_info:
-            methods = self.viewset_info[view_name].get("methods", [])
+        if view_name and view_name in self.api_views:
+            methods = list(self.api_views[view_name])
         
         # Check for methods kwarg in as_view() for CBVs
-        if (
-            isinstance(view_arg, ast.Call) 
-            and isinstance(view_arg.func, ast.Attribute) 
-            and view_arg.func.attr == "as_view"
-        ):
-            http_method_kw = next((kw for kw in view_arg.keywords if kw.arg == "http_method_names"), None)
-            if http_method_kw:
-                methods = _str_list(http_method_kw.value)
-            
-            # Check for methods in the as_view({}) method mapping
-            methods_dict = next((arg for arg in view_arg.args if isinstance(arg, (ast.Dict))), None)
-            if methods_dict and hasattr(methods_dict, 'keys') and methods_dict.keys:
-                # Extract HTTP methods from the dictionary keys
-                methods.extend([_str(k).lower() for k in methods_dict.keys if _str(k)])
+        match view_arg:
+            case ast.Call(func=ast.Attribute(attr="as_view"), args=as_view_args, keywords=as_view_kws):
+                http_method_kw = next((kw for kw in as_view_kws if kw.arg == "http_method_names"), None)
+                if http_method_kw:
+                    methods = _str_list(http_method_kw.value)
+                
+                # Check for methods in the as_view({}) method mapping
+                methods_dict = next((arg for arg in as_view_args if isinstance(arg, ast.Dict)), None)
+                if methods_dict and methods_dict.keys:
+                    # Extract HTTP methods from the dictionary keys
+                    methods.extend(_http_methods([k for k in map(_str, methods_dict.keys) if k]))
 
         # If no methods detected, fall back to 'methods' kwarg or default to GET
         if not methods:
             methods_kw = next((kw for kw in node.keywords if kw.arg == "methods"), None)
-            methods = [m.lower() for m in _str_list(methods_kw.value)] if methods_kw else ["get"]
+            methods = _http_methods(_str_list(methods_kw.value)) if methods_kw else ["get"]
 
         # Add the route
         self._add_route(full_raw, methods, op_id, f"{methods} {raw_path}")
@@ -316,99 +440,40 @@ class URLVisitor(ast.NodeVisitor):
         openapi_path, params = _django_to_openapi(raw_path)
         
         # Skip if we've already registered this exact route (to avoid duplicates from inference)
-        path_method_key = f"{openapi_path}:{','.join(sorted(methods))}"
+        path_method_key = (openapi_path, *sorted(methods))
         if path_method_key in self.route_patterns:
             return
         self.route_patterns.add(path_method_key)
         
-        for m in methods:
-            self.routes.append(
-                {
-                    "path": openapi_path,
-                    "method": m,
-                    "operation_id": f"{op_id}_{m}" if m != "get" else op_id,
-                    "description": description or f"{m.upper()} {raw_path}",
-                    "parameters": params,
-                }
-            )
-
-
-# ─── Decorator visitor to detect @api_view ───────────────────
-class DecoratorVisitor(ast.NodeVisitor):
-    """Walk AST tree to find function decorators, especially @api_view."""
-    
-    def __init__(self) -> None:
-        self.api_views: Dict[str, List[str]] = {}  # function name -> methods
-    
-    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:  # type: ignore[override]
-        for decorator in node.decorator_list:
-            if isinstance(decorator, ast.Call) and isinstance(decorator.func, ast.Name):
-                if decorator.func.id == "api_view" and decorator.args:
-                    methods = _str_list(decorator.args[0])
-                    if methods:
-                        self.api_views[node.name] = [m.lower() for m in methods]
-                # Add parent function reference to help in the main visitor
-                decorator.parent_func = ast.Name(id=node.name)
-        self.generic_visit(node)
-
-
-# ─── ViewSet analysis visitor ───────────────────────────────
-class ViewSetVisitor(ast.NodeVisitor):
-    """Walk AST tree to find ViewSet classes and their actions."""
-    
-    def __init__(self) -> None:
-        self.viewsets: Dict[str, Dict[str, Any]] = {}  # class name -> info
-    
-    def visit_ClassDef(self, node: ast.ClassDef) -> None:  # type: ignore[override]
-        # Check if this is potentially a ViewSet
-        is_viewset = False
-        for base in node.bases:
-            if isinstance(base, ast.Name) and "ViewSet" in base.id:
-                is_viewset = True
-            elif isinstance(base, ast.Attribute) and "ViewSet" in base.attr:
-                is_viewset = True
-        
-        if is_viewset:
-            viewset_info = {
-                "actions": [],
-                "detail_actions": [],
-                "custom_methods": {}
+        # One extend per call; `params` is shared by reference across methods
+        self.routes.extend(
+            {
+                "path": openapi_path,
+                "method": m,
+                "operation_id": f"{op_id}_{m}" if m != "get" else op_id,
+                "description": description or f"{m.upper()} {raw_path}",
+                "parameters": params,
             }
-            
-            # Look for action decorators
-            for item in node.body:
-                if isinstance(item, ast.FunctionDef):
-                    action_detail = None
-                    action_methods = []
-                    
-                    for decorator in item.decorator_list:
-                        if (isinstance(decorator, ast.Call) and 
-                            isinstance(decorator.func, ast.Name) and 
-                            decorator.func.id == "action"):
-                            
-                            # Check detail kwarg
-                            for kw in decorator.keywords:
-                                if kw.arg == "detail" and hasattr(kw.value, "value"):
-                                    action_detail = kw.value.value
-                                if kw.arg == "methods":
-                                    action_methods = _str_list(kw.value)
-                            
-                            # Store the action info
-                            if action_detail is not None:
-                                if action_detail:
-                                    viewset_info["detail_actions"].append(item.name)
-                                else:
-                                    viewset_info["actions"].append(item.name)
-                                
-                                if action_methods:
-                                    viewset_info["custom_methods"][item.name] = [m.lower() for m in action_methods]
-            
-            self.viewsets[node.name] = viewset_info
-        
-        self.generic_visit(node)
+            for m in methods
+        )
 
 
 # ───────────────────────── include() recursion ─────────────────────────
+@functools.lru_cache(maxsize=None)
+def _listing(directory: str) -> frozenset[str]:
+    """Names inside *directory*, read once per process (empty if unreadable)."""
+    try:
+        return frozenset(os.listdir(directory))
+    except OSError:
+        return frozenset()
+
+
+def _in_listing(path: str) -> bool:
+    """Existence test for *path* served from the cached parent listing."""
+    parent, name = os.path.split(path)
+    return name in _listing(parent or os.curdir)
+
+
 def _find_urls_in_app_dir(app_name: str, project_root: Path) -> Path | None:
     """Try to find the urls.py file in various common Django app structures."""
     # Check these common patterns:
@@ -417,92 +482,98 @@ def _find_urls_in_app_dir(app_name: str, project_root: Path) -> Path | None:
     # 3. apps/app/urls.py
     # 4. project_root/app/urls.py
     
+    root = str(project_root)
+    parts = app_name.split('.')
+    app_dir = os.path.join(*parts)
     patterns = [
-        Path(app_name.replace('.', os.sep)) / "urls.py",
-        Path(app_name.split('.')[0]) / app_name.split('.')[-1] / "urls.py",
-        Path("apps") / app_name.replace('.', os.sep) / "urls.py",
-        project_root / app_name.replace('.', os.sep) / "urls.py",
-        project_root / "apps" / app_name.replace('.', os.sep) / "urls.py",
+        os.path.join(app_dir, "urls.py"),
+        os.path.join(parts[0], parts[-1], "urls.py"),
+        os.path.join("apps", app_dir, "urls.py"),
+        os.path.join(root, app_dir, "urls.py"),
+        os.path.join(root, "apps", app_dir, "urls.py"),
     ]
     
     for pattern in patterns:
-        if pattern.exists():
-            return pattern
+        if _in_listing(pattern):
+            return Path(pattern)
     
-    # If the app is directly in sys.path, try to find it
-    for path in sys.path:
-        app_path = Path(path) / app_name.replace('.', os.sep) / "urls.py"
-        if app_path.exists():
-            return app_path
+    # If the app is directly on the search path, try to find it
+    for path in _search_paths(project_root):
+        app_path = os.path.join(path, app_dir, "urls.py")
+        if _in_listing(app_path):
+            return Path(app_path)
     
     return None
 
 
+@functools.lru_cache(maxsize=None)
 def _file_from_module(mod: str, project_root: Path) -> Path | None:
     """Translate dotted module path to an absolute file path."""
     # First try the direct path
-    candidate = project_root.joinpath(*mod.split(".")).with_suffix(".py")
-    if candidate.exists():
-        return candidate
+    candidate = os.path.join(str(project_root), *mod.split(".")) + ".py"
+    if _in_listing(candidate):
+        return Path(candidate)
     
     # Then try to find it in common app structures
     app_urls = _find_urls_in_app_dir(mod, project_root) 
     if app_urls:
         return app_urls
     
-    # Finally, try importlib as a last resort
-    try:
-        spec = importlib.util.find_spec(mod)
-        if spec and spec.origin and spec.origin.endswith(".py"):
-            return Path(spec.origin)
-    except ModuleNotFoundError:
-        pass
+    # Finally, try importlib's path finder as a last resort
+    spec = _find_module_spec(mod, _search_paths(project_root))
+    if spec and spec.origin and spec.origin.endswith(".py"):
+        return Path(spec.origin)
     
     return None
 
 
+# Included modules are read and parsed ahead of the (sequential) walk
+_PARSE_POOL = ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
+
+
 def _walk(urls_file: Path, project_root: Path,
           prefix: str = "", seen: Set[Path] | None = None,
-          collect_viewsets: bool = True) -> List[Dict]:
+          in_flight: Dict[Path, Future] | None = None) -> List[Dict]:
     if seen is None:
         seen = set()
+    if in_flight is None:
+        in_flight = {}
     urls_file = urls_file.resolve()
     if urls_file in seen or not urls_file.exists():
         return []
     seen.add(urls_file)
 
     try:
-        content = urls_file.read_text(encoding="utf-8")
-        tree = ast.parse(content)
+        pending = in_flight.get(urls_file)
+        tree = pending.result() if pending is not None else _parse_urls(str(urls_file))
     except Exception as exc:  # pragma: no cover
         print(f"⚠️  Could not parse {urls_file}: {exc}", file=sys.stderr)
         return []
+    if tree is None:
+        return []
 
-    # First scan for @api_view decorators
-    decorator_visitor = DecoratorVisitor()
-    decorator_visitor.visit(tree)
-    
-    # If requested, look for ViewSet classes to extract more info
-    viewset_info = {}
-    if collect_viewsets:
-        viewset_visitor = ViewSetVisitor()
-        viewset_visitor.visit(tree)
-        viewset_info = viewset_visitor.viewsets
-    
-    visitor = URLVisitor(prefix)
-    # Add info from decorators
-    for func_name, methods in decorator_visitor.api_views.items():
-        visitor._store_api_view_methods(func_name, methods)
-    
-    visitor.visit(tree)
+    visitor = CombinedVisitor(prefix)
+    visitor.collect(tree)
 
-    routes = list(visitor.routes)
+    subs: List[Tuple[Path, str]] = []
     for mod, new_pref in visitor.includes:
         sub = _file_from_module(mod, project_root)
         if sub:
-            routes.extend(_walk(sub, project_root, new_pref, seen, collect_viewsets))
+            subs.append((sub.resolve(), new_pref))
         else:
             print(f"⚠️  Could not resolve module '{mod}' - skipping")
+
+    # Prefetch every include of this level concurrently; visiting stays in
+    # order below so `seen` and route order match a plain depth-first walk.
+    # `in_flight` is shared by the whole walk, so a file included at several
+    # levels is submitted once even before it has been visited.
+    for sub, _ in subs:
+        if sub not in seen and sub not in in_flight:
+            in_flight[sub] = _PARSE_POOL.submit(_parse_urls, str(sub))
+
+    routes = list(visitor.routes)
+    for sub, new_pref in subs:
+        routes.extend(_walk(sub, project_root, new_pref, seen, in_flight))
     return routes
 
 
@@ -522,7 +593,7 @@ def _build_spec(routes: List[Dict]) -> Dict:
     seen_routes = set()
     unique_routes = []
     for r in routes:
-        key = f"{r['path']}:{r['method']}"
+        key = (r["path"], r["method"])
         if key not in seen_routes:
             seen_routes.add(key)
             unique_routes.append(r)
@@ -578,18 +649,13 @@ def main() -> None:
         sys.exit(f"❌  '{entry_path}' not found")
 
     project_root = Path(args.project_root).resolve()
-    _ensure_on_syspath(project_root)
-    
-    # Add common Django app directories to sys.path
-    for possible_path in [project_root, project_root.parent, project_root / "apps"]:
-        _ensure_on_syspath(possible_path)
 
     print("🔍  Statically scanning Django URL‑confs …")
     
-    # Debug: print all sys.path entries if debug is enabled
+    # Debug: print all module search paths if debug is enabled
     if args.debug:
-        print("Debug - sys.path entries:")
-        for p in sys.path:
+        print("Debug - module search paths:")
+        for p in _search_paths(project_root):
             print(f"  - {p}")
     
     routes = _walk(entry_path, project_root)
@@ -599,7 +665,8 @@ def main() -> None:
 
     output_path = Path(args.output).resolve()
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(json.dumps(spec, indent=2), encoding="utf-8")
+    with output_path.open("w", encoding="utf-8", buffering=1 << 20) as fh:
+        json.dump(spec, fh, indent=2)
     print(f"📄  OpenAPI spec written to {output_path}")
 
 
@@ -3,7 +3,7 @@
 Non-invasive OpenAPI specification generator for Django applications.
 This script inspects a Django application through static analysis without executing its code.
 
-Usage: python django_creator.py -e <django_project_root> -o <output_file>
+Usage (Python 3.10+): python django_creator.py -e <django_project_root> -o <output_file>
 
 Note: This generator sets the base path to '/proxy/django' for all endpoints.
 """
@@ -14,24 +14,226 @@ import json
 import ast
 import argparse
 import importlib.util
+import inspect
 import traceback
+import concurrent.futures
+import logging
+import dataclasses
+import collections
+import mmap
+import functools
+import bisect
+import hashlib
+import pickle
 from pathlib import Path
 from apispec import APISpec
 from apispec.ext.marshmallow import MarshmallowPlugin
-from typing import List, Dict, Any, Optional, Set, Tuple
+from typing import List, Dict, Any, Optional, Set, Tuple, Union
 
-class DjangoURLPatternVisitor(ast.NodeVisitor):
+try:
+    import orjson
+except ImportError:  # optional speed-up; stdlib json is the fallback
+    orjson = None
+
+# URL discovery reports per-route detail at DEBUG; main() sets the level from -v
+logger = logging.getLogger(__name__)
+
+
+def _const_str(node):
+    """Return the value of a string literal node, or None for anything else."""
+    # ast.Str is a deprecated alias; string literals are ast.Constant since 3.8
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    return None
+
+
+def _leaf_name(node):
+    """Return the last name of a Name or dotted Attribute (validators.validate_required), else None."""
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return None
+
+
+def _docstring(node):
+    """ast.get_docstring for a def/class node, skipping cleandoc when a one-liner needs none."""
+    first = node.body[0] if node.body else None
+    if not isinstance(first, ast.Expr):
+        return None
+    doc = _const_str(first.value)
+    if doc is None:
+        return None
+    if '\n' in doc or '\t' in doc:
+        return inspect.cleandoc(doc)
+    # All cleandoc does to a single line is strip its leading whitespace
+    return doc.lstrip()
+
+
+@dataclasses.dataclass(slots=True)
+class URLPattern:
+    """A single route discovered in a URLconf."""
+    path: str
+    view: str
+    name: Optional[str] = None
+    namespace: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Optional[str]]:
+        """The route as a plain dict, for JSON output of analyze_django_project's results."""
+        return {'path': self.path, 'view': self.view, 'name': self.name, 'namespace': self.namespace}
+
+
+# An include() left in a file's scan for extract_urls_from_file to follow:
+# (included urls file, path prefix, namespace, strip the included paths' leading slash)
+_IncludeRef = Tuple[str, str, Optional[str], bool]
+
+# (path, mtime_ns, size) -> that file's own patterns and include references
+_URL_PATTERN_CACHE: Dict[Tuple[str, int, int], List[Union[URLPattern, _IncludeRef]]] = {}
+
+# (path, mtime_ns, size) -> the viewsets / models extracted from that version of the file
+_VIEWS_CACHE: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+_MODELS_CACHE: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+
+# The CLI also keeps views/models extractions between runs, one pickle per project next to
+# the Flask creator's spec cache. Entries are keyed by (extractor, absolute path, mtime_ns,
+# size) and the file as a whole by this module's mtime. urls scans are not kept: the nested
+# api/ lookup makes them depend on the directory listing as well as on the file
+_EXTRACT_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache")),
+    "spec_creator", "django",
+)
+_PERSISTENT_EXTRACTS = frozenset({'_extract_views', '_extract_models'})
+# Entries read from disk (None while the CLI has not enabled the cache), and those this run used
+_DISK_CACHE: Optional[Dict[Tuple[str, str, int, int], Dict[str, Any]]] = None
+_DISK_CACHE_USED: Dict[Tuple[str, str, int, int], Dict[str, Any]] = {}
+
+# Regex named groups such as (?P<pk>\d+) and their OpenAPI {pk} replacement
+_NAMED_GROUP_RE = re.compile(r'\(\?P<([^>]+)>[^)]+\)')
+_NAMED_GROUP_SUB = r'{\1}'
+
+# A path parameter in either syntax: <int:pk> / <pk> (group 1) or a regex (?P<pk>\d+) (group 2)
+_PATH_PARAM_RE = re.compile(r'<(?:[^:]+:)?([^>]+)>|\(\?P<([^>]+)>[^)]+\)')
+
+# Serializer class names, whose prefix names the model they serialize
+_SERIALIZER_CLASS_RE = re.compile(r'class\s+(\w+)Serializer')
+
+# Leading name of a view expression like views.my_view or MyViewClass.as_view()
+_VIEW_NAME_RE = re.compile(r'(\w+)(?:\.as_view\(\)|$|\W)')
+
+# Route prefixes served by Django itself rather than the API
+_SKIP_PATH_RE = re.compile(r'admin|static|media')
+
+# API version prefix on a path segment, e.g. the v1 in v1tasks
+_VERSION_RE = re.compile(r'^v\d+')
+
+# operationId cleanup: OpenAPI {param} placeholders, non-identifier characters, underscore runs
+_BRACED_PARAM_RE = re.compile(r'\{[^}]+\}')
+_NON_IDENT_RE = re.compile(r'[^a-z0-9_]')
+_UNDERSCORE_RUN_RE = re.compile(r'_+')
+
+# Byte strings at least one of which appears in any file extract_urls_from_file can use
+_URL_MARKERS = (b'urlpatterns', b'.register(', b'path(', b'url(')
+
+# Directories never worth descending into when looking for project sources
+_SKIP_DIRS = frozenset({
+    '.git', '__pycache__', 'node_modules', 'venv', '.venv', 'site-packages', '.tox', '.mypy_cache'
+})
+
+# Directories whose modules never define the project's URLs, models or views
+_PROJECT_SKIP_DIRS = _SKIP_DIRS | {'migrations', 'tests'}
+
+# Paths already under the API prefix, with or without a leading slash
+_API_PREFIXES = ('api/', '/api/')
+
+# Bytes whose presence in a urls.py suggests it declares API endpoints
+_API_URL_MARKERS = (b'rest_framework', b'router', b'api', b'viewsets', b'APIView')
+
+# (path, mtime_ns, size) -> raw source read by _scan_project, handed to the first parse of that version
+_PRELOADED_SOURCES: Dict[Tuple[str, int, int], bytes] = {}
+
+# Model fields that reference another model
+_RELATION_FIELDS = frozenset({'ForeignKey', 'OneToOneField', 'ManyToManyField'})
+
+# Operations generate_openapi_spec emits: skipped methods, methods taking the model as
+# request body, methods returning it, and parameters that make a path a single-item one
+_UNDOCUMENTED_METHODS = frozenset({'options', 'head'})
+_BODY_METHODS = frozenset({'post', 'put', 'patch'})
+_MODEL_RESPONSE_METHODS = _BODY_METHODS | {'get'}
+_DETAIL_PARAM_NAMES = frozenset({'pk', 'id'})
+
+# Standard ViewSet action -> HTTP method
+_ACTION_HTTP_METHODS = {
+    'list': 'get',
+    'create': 'post',
+    'retrieve': 'get',
+    'update': 'put',
+    'partial_update': 'patch',
+    'destroy': 'delete'
+}
+_STANDARD_ACTIONS = frozenset(_ACTION_HTTP_METHODS)
+
+# ViewSet methods that are neither standard actions nor custom @action endpoints
+_SKIP_METHODS = frozenset({'__init__', 'get_queryset', 'get_serializer_class'})
+
+# Custom action names containing any of these are assumed to act on a single object
+_DETAIL_ACTION_WORDS = ('delete', 'edit', 'update', 'get_', 'set_', 'by_id')
+
+# Node class -> names of the fields that may hold child nodes, filled lazily
+_CHILD_FIELDS: Dict[type, Tuple[str, ...]] = {}
+
+
+class _DispatchVisitor(ast.NodeVisitor):
+    """NodeVisitor with a type-keyed handler table and a field-classified generic_visit.
+    
+    Subclasses list their handlers in _DISPATCH. Visitors whose handlers never
+    look at expressions set _VISIT_EXPRESSIONS = False so the walk only descends
+    through statements.
+    """
+    _DISPATCH: Dict[type, Any] = {}
+    _VISIT_EXPRESSIONS = True
+    
+    def visit(self, node):
+        handler = self._DISPATCH.get(type(node))
+        if handler is not None:
+            return handler(self, node)
+        return self.generic_visit(node)
+        
+    def generic_visit(self, node):
+        fields = _CHILD_FIELDS.get(type(node))
+        if fields is None:
+            fields = _CHILD_FIELDS[type(node)] = tuple(node._fields)
+        skip = () if self._VISIT_EXPRESSIONS else ast.expr
+        visit = self.visit
+        for field in fields:
+            value = getattr(node, field, None)
+            if isinstance(value, list):
+                for item in value:
+                    if isinstance(item, ast.AST) and not isinstance(item, skip):
+                        visit(item)
+            elif isinstance(value, ast.AST) and not isinstance(value, skip):
+                visit(value)
+
+
+class DjangoURLPatternVisitor(_DispatchVisitor):
     """AST visitor to extract Django URL patterns without executing the code."""
     def __init__(self):
         self.patterns = []
         self.imports = {}
         self.current_namespace = None
         self.include_patterns = []
+        # Collected in one traversal for extract_urls_from_file
+        self.viewset_imports = {}
+        self.routers = []
+        self.registrations = []
+        self.route_calls = []
+        self.url_calls = []
+        self.actions = {}
+        self.has_api_prefix = False
         
     def visit_Import(self, node):
         """Process import statements."""
         for name in node.names:
-            self.imports[name.name.split('.')[-1]] = name.name
+            self.imports[name.name.rpartition('.')[2]] = name.name
         self.generic_visit(node)
         
     def visit_ImportFrom(self, node):
@@ -39,10 +241,18 @@ class DjangoURLPatternVisitor(ast.NodeVisitor):
         if node.module:
             for name in node.names:
                 self.imports[name.name] = f"{node.module}.{name.name}"
+        module_path = '.' * node.level + (node.module or '')
+        for name in node.names:
+            if 'ViewSet' in name.name or (name.asname and 'ViewSet' in name.asname):
+                self.viewset_imports[name.asname or name.name] = f"{module_path}.{name.name}"
         self.generic_visit(node)
         
     def visit_Assign(self, node):
-        """Process variable assignments for urlpatterns."""
+        """Process variable assignments for urlpatterns and DRF routers."""
+        if isinstance(node.value, ast.Call) and self._call_name(node.value).endswith('Router'):
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    self.routers.append(target.id)
         for target in node.targets:
             if isinstance(target, ast.Name) and target.id == 'urlpatterns':
                 if isinstance(node.value, ast.List):
@@ -50,6 +260,64 @@ class DjangoURLPatternVisitor(ast.NodeVisitor):
                         self._process_url_pattern(element)
         self.generic_visit(node)
         
+    def visit_ClassDef(self, node):
+        """Record methods decorated with @action on classes defined in the file."""
+        actions = [
+            item.name for item in node.body
+            if isinstance(item, ast.FunctionDef) and any(self._is_action(d) for d in item.decorator_list)
+        ]
+        if actions:
+            self.actions[node.name] = actions
+        self.generic_visit(node)
+        
+    def visit_Call(self, node):
+        """Process path()/re_path()/url() routes and router.register() calls anywhere in the file."""
+        func = node.func
+        if isinstance(func, ast.Attribute) and func.attr == 'register':
+            self._process_register(node)
+        elif isinstance(func, ast.Name) and func.id in ('path', 're_path', 'url') and len(node.args) >= 2:
+            route = _const_str(node.args[0])
+            if route is not None:
+                view = node.args[1]
+                if self._call_name(view) == 'include':
+                    entry = (route, None, self._extract_include(view))
+                else:
+                    entry = (route, self._leading_name(view), None)
+                if func.id == 'path':
+                    self.route_calls.append(entry)
+                    if route in ('api', 'api/'):
+                        self.has_api_prefix = True
+                else:
+                    self.url_calls.append(entry)
+        self.generic_visit(node)
+        
+    _DISPATCH = {
+        ast.Import: visit_Import,
+        ast.ImportFrom: visit_ImportFrom,
+        ast.Assign: visit_Assign,
+        ast.ClassDef: visit_ClassDef,
+        ast.Call: visit_Call,
+    }
+        
+    def _process_register(self, node):
+        """Record a router.register(prefix, ViewSet) call."""
+        receiver = node.func.value
+        if isinstance(receiver, ast.Name):
+            router = receiver.id
+        elif isinstance(receiver, ast.Call) and self._call_name(receiver) == 'DefaultRouter':
+            router = 'DefaultRouter()'
+        else:
+            return
+        if len(node.args) < 2:
+            return
+        prefix, viewset = _const_str(node.args[0]), node.args[1]
+        if prefix is None:
+            return
+        if isinstance(viewset, ast.Name):
+            self.registrations.append((router, prefix, viewset.id))
+        elif isinstance(viewset, ast.Attribute):
+            self.registrations.append((router, prefix, viewset.attr))
+        
     def _process_url_pattern(self, node):
         """Process a URL pattern from urlpatterns list."""
         if not isinstance(node, ast.Call):
@@ -63,8 +331,7 @@ class DjangoURLPatternVisitor(ast.NodeVisitor):
             
             # Get the path/route pattern
             if node.args and len(node.args) >= 1:
-                if isinstance(node.args[0], ast.Str):
-                    route_pattern = node.args[0].s
+                route_pattern = _const_str(node.args[0])
                     
             # Get the view function/class
             if len(node.args) >= 2:
@@ -72,40 +339,47 @@ class DjangoURLPatternVisitor(ast.NodeVisitor):
                 
             # Look for name in keywords
             for keyword in node.keywords:
-                if keyword.arg == 'name' and isinstance(keyword.value, ast.Str):
-                    name = keyword.value.s
+                if keyword.arg == 'name':
+                    name = _const_str(keyword.value)
                     
             if route_pattern is not None and view_func is not None:
-                self.patterns.append({
-                    'path': route_pattern,
-                    'view': view_func,
-                    'name': name,
-                    'namespace': self.current_namespace
-                })
+                self.patterns.append(URLPattern(
+                    path=route_pattern,
+                    view=view_func,
+                    name=name,
+                    namespace=self.current_namespace
+                ))
                 
         # Handle include() for nested URLconf
         elif isinstance(node.func, ast.Name) and node.func.id == 'include':
-            if node.args and len(node.args) >= 1:
-                include_path = None
-                namespace = None
+            include_info = self._extract_include(node)
+            if include_info:
+                self.include_patterns.append(include_info)
+                    
+    def _extract_include(self, node):
+        """Extract the dotted module and namespace of an include() call."""
+        if not node.args:
+            return None
+        include_path = None
+        namespace = None
+        
+        # Get the include path
+        if isinstance(node.args[0], ast.Tuple) and len(node.args[0].elts) >= 1:
+            include_path = _const_str(node.args[0].elts[0])
+        else:
+            include_path = _const_str(node.args[0])
                 
-                # Get the include path
-                if isinstance(node.args[0], ast.Str):
-                    include_path = node.args[0].s
-                elif isinstance(node.args[0], ast.Tuple) and len(node.args[0].elts) >= 1:
-                    if isinstance(node.args[0].elts[0], ast.Str):
-                        include_path = node.args[0].elts[0].s
-                        
-                # Look for namespace in keywords
-                for keyword in node.keywords:
-                    if keyword.arg == 'namespace' and isinstance(keyword.value, ast.Str):
-                        namespace = keyword.value.s
-                        
-                if include_path:
-                    self.include_patterns.append({
-                        'include': include_path,
-                        'namespace': namespace
-                    })
+        # Look for namespace in keywords
+        for keyword in node.keywords:
+            if keyword.arg == 'namespace':
+                namespace = _const_str(keyword.value)
+                
+        if include_path:
+            return {
+                'include': include_path,
+                'namespace': namespace
+            }
+        return None
                     
     def _extract_view_func(self, node):
         """Extract view function or class from AST node."""
@@ -115,9 +389,36 @@ class DjangoURLPatternVisitor(ast.NodeVisitor):
             if isinstance(node.value, ast.Name):
                 return f"{node.value.id}.{node.attr}"
         return None
+        
+    def _leading_name(self, node):
+        """Return the leftmost name of a view expression (views.x -> views, X.as_view() -> X)."""
+        while True:
+            if isinstance(node, ast.Name):
+                return node.id
+            elif isinstance(node, (ast.Attribute, ast.Subscript)):
+                node = node.value
+            elif isinstance(node, ast.Call):
+                node = node.func
+            else:
+                return None
+                
+    def _call_name(self, node):
+        """Return the callee name of a call expression, or '' for anything else."""
+        if isinstance(node, ast.Call):
+            if isinstance(node.func, ast.Name):
+                return node.func.id
+            elif isinstance(node.func, ast.Attribute):
+                return node.func.attr
+        return ''
+        
+    def _is_action(self, decorator):
+        """Check whether a decorator is DRF's @action or @action(...)."""
+        if isinstance(decorator, ast.Call):
+            decorator = decorator.func
+        return isinstance(decorator, ast.Name) and decorator.id == 'action'
 
 
-class DjangoViewSetVisitor(ast.NodeVisitor):
+class DjangoViewSetVisitor(_DispatchVisitor):
     """AST visitor to extract ViewSet class information."""
     def __init__(self):
         self.viewsets = {}
@@ -138,12 +439,12 @@ class DjangoViewSetVisitor(ast.NodeVisitor):
             if isinstance(base, ast.Name):
                 base_name = base.id
                 base_classes.append(base_name)
-                if base_name.endswith('ViewSet') or base_name.endswith('ModelViewSet'):
+                if base_name.endswith('ViewSet'):
                     is_viewset = True
             elif isinstance(base, ast.Attribute) and isinstance(base.value, ast.Name):
                 base_name = f"{base.value.id}.{base.attr}"
                 base_classes.append(base_name)
-                if base_name.endswith('ViewSet') or base_name.endswith('ModelViewSet'):
+                if base_name.endswith('ViewSet'):
                     is_viewset = True
                     
         self.base_classes = base_classes
@@ -151,27 +452,38 @@ class DjangoViewSetVisitor(ast.NodeVisitor):
         # If it's a ViewSet, gather info about its methods
         if is_viewset:
             methods = {}
+            queryset_model = None
+            serializer_class = None
             for item in node.body:
                 if isinstance(item, ast.FunctionDef):
                     method = item.name
-                    doc = ast.get_docstring(item)
+                    doc = _docstring(item)
                     # Standard ViewSet methods
-                    if method in ('list', 'create', 'retrieve', 'update', 'partial_update', 'destroy'):
+                    if method in _STANDARD_ACTIONS:
                         http_method = self._get_http_method_for_action(method)
                         methods[method] = {
                             'http_method': http_method,
                             'description': doc or f"{method.capitalize()} method"
                         }
                     # Custom methods with action decorator
-                    elif method not in ('__init__', 'get_queryset', 'get_serializer_class'):
+                    elif method not in _SKIP_METHODS:
                         action_info = self._extract_action_info(item)
                         if action_info:
                             methods[method] = action_info
                             methods[method]['description'] = doc or f"{method.capitalize()} method"
-            
-            # Get the queryset model and serializer if defined
-            queryset_model = self._extract_queryset_model(node)
-            serializer_class = self._extract_serializer_class(node)
+                # Get the queryset model and serializer if defined
+                elif isinstance(item, ast.Assign):
+                    for target in item.targets:
+                        if not isinstance(target, ast.Name):
+                            continue
+                        if target.id == 'queryset' and queryset_model is None:
+                            value = item.value
+                            if isinstance(value, ast.Call) and isinstance(value.func, ast.Attribute):
+                                if value.func.attr == 'all' and isinstance(value.func.value, ast.Name):
+                                    queryset_model = value.func.value.id
+                        elif target.id == 'serializer_class' and serializer_class is None:
+                            if isinstance(item.value, ast.Name):
+                                serializer_class = item.value.id
             
             self.viewsets[node.name] = {
                 'methods': methods,
@@ -186,17 +498,12 @@ class DjangoViewSetVisitor(ast.NodeVisitor):
         # Restore previous class context
         self.current_class = prev_class
         
+    _DISPATCH = {ast.ClassDef: visit_ClassDef}
+    _VISIT_EXPRESSIONS = False
+        
     def _get_http_method_for_action(self, action: str) -> str:
         """Map standard ViewSet action to HTTP method."""
-        action_map = {
-            'list': 'get',
-            'create': 'post',
-            'retrieve': 'get',
-            'update': 'put',
-            'partial_update': 'patch',
-            'destroy': 'delete'
-        }
-        return action_map.get(action, 'get')
+        return _ACTION_HTTP_METHODS.get(action, 'get')
         
     def _extract_action_info(self, node: ast.FunctionDef) -> Optional[Dict[str, Any]]:
         """Extract information from @action decorator."""
@@ -215,36 +522,14 @@ class DjangoViewSetVisitor(ast.NodeVisitor):
                     elif keyword.arg == 'methods':
                         if isinstance(keyword.value, ast.List) and keyword.value.elts:
                             # Take the first method in the list
-                            if isinstance(keyword.value.elts[0], ast.Str):
-                                action_info['http_method'] = keyword.value.elts[0].s.lower()
-                            elif hasattr(keyword.value.elts[0], 'value'):  # For Python 3.8+ Constant
-                                action_info['http_method'] = keyword.value.elts[0].value.lower()
+                            first = _const_str(keyword.value.elts[0])
+                            if first is not None:
+                                action_info['http_method'] = first.lower()
                 return action_info
         return None
-        
-    def _extract_queryset_model(self, node: ast.ClassDef) -> Optional[str]:
-        """Extract the model from queryset attribute."""
-        for item in node.body:
-            if isinstance(item, ast.Assign):
-                for target in item.targets:
-                    if isinstance(target, ast.Name) and target.id == 'queryset':
-                        if isinstance(item.value, ast.Call) and isinstance(item.value.func, ast.Attribute):
-                            if item.value.func.attr == 'all' and isinstance(item.value.func.value, ast.Name):
-                                return item.value.func.value.id
-        return None
-        
-    def _extract_serializer_class(self, node: ast.ClassDef) -> Optional[str]:
-        """Extract the serializer_class attribute."""
-        for item in node.body:
-            if isinstance(item, ast.Assign):
-                for target in item.targets:
-                    if isinstance(target, ast.Name) and target.id == 'serializer_class':
-                        if isinstance(item.value, ast.Name):
-                            return item.value.id
-        return None
 
 
-class DjangoModelVisitor(ast.NodeVisitor):
+class DjangoModelVisitor(_DispatchVisitor):
     """AST visitor to extract Django model fields."""
     def __init__(self):
         self.models = {}
@@ -263,6 +548,7 @@ class DjangoModelVisitor(ast.NodeVisitor):
                     
         if is_model:
             fields = {}
+            validations = {}
             for item in node.body:
                 if isinstance(item, ast.Assign):
                     for target in item.targets:
@@ -271,14 +557,21 @@ class DjangoModelVisitor(ast.NodeVisitor):
                             field_type = self._extract_field_type(item.value)
                             if field_type:
                                 fields[field_name] = field_type
+                                field_validations = self._extract_validations(item.value)
+                                if field_validations:
+                                    validations[field_name] = field_validations
                                 
             self.models[node.name] = {
                 'fields': fields,
-                'doc': ast.get_docstring(node)
+                'validations': validations,
+                'doc': _docstring(node)
             }
             
         self.generic_visit(node)
         
+    _DISPATCH = {ast.ClassDef: visit_ClassDef}
+    _VISIT_EXPRESSIONS = False
+        
     def _extract_field_type(self, node):
         """Extract field type from field definition."""
         if isinstance(node, ast.Call):
@@ -287,6 +580,102 @@ class DjangoModelVisitor(ast.NodeVisitor):
                     return node.func.attr
         return None
 
+    def _extract_validations(self, node):
+        """Read null=False, validators=[validate_required] and max_length= off a field call."""
+        required = False
+        max_length = None
+        for keyword in node.keywords:
+            value = keyword.value
+            if keyword.arg == 'null':
+                if isinstance(value, ast.Constant) and value.value is False:
+                    required = True
+            elif keyword.arg == 'validators':
+                if isinstance(value, (ast.List, ast.Tuple)) and any(
+                        _leaf_name(elt) == 'validate_required' for elt in value.elts):
+                    required = True
+            elif keyword.arg == 'max_length':
+                if isinstance(value, ast.Constant) and type(value.value) is int:
+                    max_length = value.value
+        validations = {}
+        if required:
+            validations['required'] = True
+        if max_length is not None:
+            validations['max_length'] = max_length
+        return validations
+
+
+# Special cases and irregular plurals
+_IRREGULAR_PLURALS = {
+    'person': 'people',
+    'man': 'men',
+    'woman': 'women',
+    'child': 'children',
+    'foot': 'feet',
+    'tooth': 'teeth',
+    'goose': 'geese',
+    'mouse': 'mice',
+    'ox': 'oxen',
+    'leaf': 'leaves',
+    'life': 'lives',
+    'knife': 'knives',
+    'wife': 'wives',
+    'elf': 'elves',
+    'loaf': 'loaves',
+    'potato': 'potatoes',
+    'tomato': 'tomatoes',
+    'cactus': 'cacti',
+    'focus': 'foci',
+    'fungus': 'fungi',
+    'nucleus': 'nuclei',
+    'syllabus': 'syllabi',
+    'analysis': 'analyses',
+    'diagnosis': 'diagnoses',
+    'basis': 'bases',
+    'crisis': 'crises',
+    'thesis': 'theses',
+    'datum': 'data',
+    'medium': 'media',
+    'criterion': 'criteria',
+    'index': 'indices',
+    'matrix': 'matrices',
+    'vertex': 'vertices',
+    'alumnus': 'alumni',
+    'series': 'series',
+    'species': 'species',
+    'deer': 'deer',
+    'fish': 'fish',
+    'sheep': 'sheep',
+    'moose': 'moose',
+    'aircraft': 'aircraft',
+}
+
+# Words starting with anything else cannot be irregular, so they skip the dict probe
+_IRREGULAR_FIRST_CHARS = frozenset(word[0] for word in _IRREGULAR_PLURALS)
+
+# Words ending in -o that just take -s
+_PLURAL_O_EXCEPTIONS = frozenset({'photo', 'piano', 'halo', 'studio', 'video', 'radio', 'solo'})
+
+# Suffix rules, one named group each; every suffix is at most two characters,
+# so the leftmost match near the end of the word is also the highest-priority rule
+_PLURAL_RE = re.compile(
+    r'(?P<is>is)$|(?P<on>on)$|(?P<us>us)$|(?P<fe>fe)$|(?P<f>f)$'
+    r'|(?P<ycons>[^aeiou]y)$|(?P<ocons>[^aeiou]o)$|(?P<exix>[ei]x)$'
+    r'|(?P<sibilant>s|ss|sh|ch|x|z)$'
+)
+
+# Rule name -> (characters to strip, suffix to append)
+_PLURAL_RULES = {
+    'is': (2, 'es'),          # analysis -> analyses
+    'on': (2, 'a'),           # criterion -> criteria
+    'us': (2, 'i'),           # cactus -> cacti
+    'fe': (2, 'ves'),         # knife -> knives
+    'f': (1, 'ves'),          # leaf -> leaves
+    'ycons': (1, 'ies'),      # city -> cities (consonant before y)
+    'ocons': (0, 'es'),       # hero -> heroes (consonant before o)
+    'exix': (2, 'ices'),      # index -> indices
+    'sibilant': (0, 'es'),    # box -> boxes
+}
+
 
 def pluralize(word):
     """Convert singular to plural with better handling of English language rules."""
@@ -295,149 +684,240 @@ def pluralize(word):
         
     word = word.lower()  # Ensure lowercase for consistency
     
-    # Special cases and irregular plurals
-    irregulars = {
-        'person': 'people',
-        'man': 'men',
-        'woman': 'women',
-        'child': 'children',
-        'foot': 'feet',
-        'tooth': 'teeth',
-        'goose': 'geese',
-        'mouse': 'mice',
-        'ox': 'oxen',
-        'leaf': 'leaves',
-        'life': 'lives',
-        'knife': 'knives',
-        'wife': 'wives',
-        'elf': 'elves',
-        'loaf': 'loaves',
-        'potato': 'potatoes',
-        'tomato': 'tomatoes',
-        'cactus': 'cacti',
-        'focus': 'foci',
-        'fungus': 'fungi',
-        'nucleus': 'nuclei',
-        'syllabus': 'syllabi',
-        'analysis': 'analyses',
-        'diagnosis': 'diagnoses',
-        'basis': 'bases',
-        'crisis': 'crises',
-        'thesis': 'theses',
-        'datum': 'data',
-        'medium': 'media',
-        'criterion': 'criteria',
-        'index': 'indices',
-        'matrix': 'matrices',
-        'vertex': 'vertices',
-        'alumnus': 'alumni',
-        'series': 'series',
-        'species': 'species',
-        'deer': 'deer',
-        'fish': 'fish',
-        'sheep': 'sheep',
-        'moose': 'moose',
-        'aircraft': 'aircraft',
-    }
-    
     # Check for irregular plural
-    if word in irregulars:
-        return irregulars[word]
-    
-    # Words ending in -is change to -es
-    if word.endswith('is'):
-        return word[:-2] + 'es'
+    if word[0] in _IRREGULAR_FIRST_CHARS:
+        irregular = _IRREGULAR_PLURALS.get(word)
+        if irregular:
+            return irregular
     
-    # Words ending in -on change to -a
-    if word.endswith('on'):
-        return word[:-2] + 'a'
-    
-    # Words ending in -us change to -i
-    if word.endswith('us'):
-        return word[:-2] + 'i'
-    
-    # Words ending in -f or -fe change to -ves
-    if word.endswith('f'):
-        return word[:-1] + 'ves'
-    if word.endswith('fe'):
-        return word[:-2] + 'ves'
-    
-    # Words ending in -y change to -ies (if consonant before y)
-    if word.endswith('y') and word[-2] not in 'aeiou':
-        return word[:-1] + 'ies'
-    
-    # Words ending in -o change to -oes (common cases)
-    if word.endswith('o') and word[-2] not in 'aeiou':
-        # Exceptions
-        if word in ['photo', 'piano', 'halo', 'studio', 'video', 'radio', 'solo']:
+    match = _PLURAL_RE.search(word, max(len(word) - 2, 0))
+    if match:
+        rule = match.lastgroup
+        if rule == 'ocons' and word in _PLURAL_O_EXCEPTIONS:
             return word + 's'
-        return word + 'es'
-    
-    # Words ending in -ex or -ix change to -ices
-    if word.endswith(('ex', 'ix')):
-        return word[:-2] + 'ices'
-    
-    # Words ending in -s, -ss, -sh, -ch, -x, -z change to -es
-    if word.endswith(('s', 'ss', 'sh', 'ch', 'x', 'z')):
-        return word + 'es'
+        strip, suffix = _PLURAL_RULES[rule]
+        return (word[:-strip] if strip else word) + suffix
     
     # Default: add s
     return word + 's'
 
 
+@functools.lru_cache(maxsize=4096)
 def join_paths(base_path: str, sub_path: str) -> str:
     """
     Properly join two URL paths handling leading and trailing slashes correctly.
     """
-    # Normalize paths to not have trailing slashes unless they're the root path
-    base_clean = base_path.rstrip('/') if base_path != '/' else '/'
-    sub_clean = sub_path.lstrip('/')
+    # The root keeps its slash; any other base drops trailing slashes before joining
+    if base_path == '/':
+        return '/' + sub_path.lstrip('/')
+    return base_path.rstrip('/') + '/' + sub_path.lstrip('/')
+
+
+def _file_key(file_path: str) -> Tuple[str, int, int]:
+    """Identify one version of a file by path, mtime and size for the parse caches."""
+    st = os.stat(file_path)
+    return file_path, st.st_mtime_ns, st.st_size
+
+
+@functools.lru_cache(maxsize=512)
+def _load_ast(file_path: str, mtime_ns: int, size: int) -> ast.Module:
+    """Read and parse a source file; the mtime/size key lets edited files evict themselves."""
+    data = _PRELOADED_SOURCES.pop((file_path, mtime_ns, size), None)
+    if data is None:
+        with open(file_path, 'rb') as f:
+            data = f.read()
+    # Parsing the bytes lets the tokenizer decode them (PEP 263 cookie or BOM, else UTF-8)
+    # and translate newlines itself, with no text-layer copy of the source
+    return ast.parse(data, filename=file_path)
+
+
+def _parse_source_file(file_path: str) -> ast.Module:
+    """Return the tree of a file, parsing it at most once per modification."""
+    return _load_ast(*_file_key(file_path))
+
+
+def _iter_files(root: str, skip_dirs: frozenset):
+    """
+    Yield the file DirEntry objects under root in os.walk's top-down order, never
+    descending into skip_dirs. scandir's d_type answers is_dir() without a stat call.
+    """
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        subdirs = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in skip_dirs:
+                            subdirs.append(entry.path)
+                    else:
+                        yield entry
+        except OSError:
+            continue
+        subdirs.reverse()
+        stack.extend(subdirs)
+
+
+@functools.lru_cache(maxsize=None)
+def _py_file_index(root: str) -> Dict[str, List[str]]:
+    """Map lowercased .py basenames under root to their paths, in os.walk order."""
+    index = collections.defaultdict(list)
+    for entry in _iter_files(root, _SKIP_DIRS):
+        if entry.name.endswith('.py'):
+            index[entry.name.lower()].append(entry.path)
+    return index
+
+
+def _find_py_file(root: str, name: str) -> Optional[str]:
+    """Find a .py file under root named after, or at least containing, name."""
+    index = _py_file_index(root)
+    needle = name.lower()
+    exact = index.get(f"{needle}.py")
+    if exact:
+        return exact[0]
+    for filename, paths in index.items():
+        if needle in filename:
+            return paths[0]
+    return None
+
+
+def _scan_project(project_root: str) -> Dict[str, List[str]]:
+    """
+    Walk the project once, reading each module's bytes a single time, and bucket the
+    paths into urls, models, views, viewsets and serializers files ('py' lists every
+    module read). The bytes are kept in _PRELOADED_SOURCES so the extractors parse
+    them without reopening the file.
+    """
+    buckets = {'py': [], 'urls': [], 'models': [], 'views': [], 'viewsets': [], 'serializers': []}
+    for entry in _iter_files(project_root, _PROJECT_SKIP_DIRS):
+        file = entry.name
+        if not file.endswith('.py'):
+            continue
+        file_path = entry.path
+        try:
+            with open(file_path, 'rb') as f:
+                st = os.fstat(f.fileno())
+                content = f.read()
+        except OSError as e:
+            print(f"   Warning: Couldn't read {file_path}: {e}")
+            continue
+        _PRELOADED_SOURCES[(file_path, st.st_mtime_ns, st.st_size)] = content
+        buckets['py'].append(file_path)
+
+        if file == 'urls.py':
+            buckets['urls'].append(file_path)
+            # Quick check if this contains API endpoints (for better diagnosis)
+            if any(marker in content for marker in _API_URL_MARKERS):
+                print(f"   Found potential API definitions in {file_path}")
+
+        # Check for model indicators
+        if file == 'models.py' or b'models.Model' in content or b'db.models' in content:
+            buckets['models'].append(file_path)
+
+        # Check for viewset indicators; ViewSet (like APIView) contains View, so a file
+        # without View needs no second scan
+        has_view = b'View' in content
+        if has_view and b'ViewSet' in content:
+            buckets['viewsets'].append(file_path)
+
+        # Check for view indicators
+        if file == 'views.py' or has_view:
+            buckets['views'].append(file_path)
+
+        # Check for serializer indicators
+        if file == 'serializers.py' or b'Serializer' in content:
+            buckets['serializers'].append(file_path)
+    return buckets
+
+
+def _find_urls_py(root: str):
+    """Yield every urls.py under root in os.walk's top-down order."""
+    for entry in _iter_files(root, _SKIP_DIRS):
+        if entry.name == 'urls.py':
+            yield entry.path
+
+
+def _has_url_markers(file_path: str) -> bool:
+    """Scan the raw bytes of a file for URL constructs before paying for a parse."""
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return False
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return any(mm.find(marker) != -1 for marker in _URL_MARKERS)
+
+
+def resolve_included_urls(parent_file: str, include_path: str) -> Optional[str]:
+    """Map an include('app.urls') argument to the urls file it names, relative to parent_file."""
+    # Handle relative imports based on parent file location
+    parent_dir = os.path.dirname(parent_file)
     
-    # Join paths
-    if base_clean == '/':
-        return f"/{sub_clean}"
+    # Convert Django dotted path to file path
+    module_parts = include_path.split('.')
+    dotted_file = os.path.join(parent_dir, *module_parts[:-1], f"{module_parts[-1]}.py")
+    if include_path.endswith('.urls'):
+        file_path = dotted_file
     else:
-        return f"{base_clean}/{sub_clean}"
+        # Handle app-level URLs
+        file_path = os.path.join(parent_dir, include_path, 'urls.py')
+        
+    if not os.path.exists(file_path):
+        # Try a different approach for app-level URLs
+        if '.' in include_path:
+            file_path = dotted_file
+            
+    return file_path if os.path.exists(file_path) else None
 
 
-def extract_urls_from_file(file_path: str) -> List[Dict[str, Any]]:
-    """Extract URL patterns from a Django URLs file."""
+def _scan_urls_file(file_path: str) -> List[Union[URLPattern, _IncludeRef]]:
+    """Collect one urls file's own routes in output order, leaving include()s as references."""
     try:
-        with open(file_path, 'r') as f:
-            source_code = f.read()
+        file_key = _file_key(file_path)
+        cached = _URL_PATTERN_CACHE.get(file_key)
+        if cached is not None:
+            return cached
+            
+        logger.info("Analyzing URL patterns in: %s", file_path)
+        
+        # Files that only forward to admin/static or define nothing routable;
+        # bytes already read by _scan_project are probed without reopening the file
+        preloaded = _PRELOADED_SOURCES.get(file_key)
+        if preloaded is not None:
+            has_markers = any(marker in preloaded for marker in _URL_MARKERS)
+        else:
+            has_markers = _has_url_markers(file_path)
+        if not has_markers:
+            _URL_PATTERN_CACHE[file_key] = []
+            return []
             
-        print(f"Analyzing URL patterns in: {file_path}")
+        tree = _load_ast(*file_key)
         
-        patterns = []
+        # A single parse and traversal collects imports, routers, registrations and routes
+        visitor = DjangoURLPatternVisitor()
+        visitor.visit(tree)
+        
+        items = []
         
         # Look for ViewSet imports first to map viewset names to their potential import paths
-        viewset_imports = {}
-        import_matches = re.finditer(r'from\s+([\w.]+)\s+import\s+([^#\n]+)', source_code)
-        for match in import_matches:
-            module_path = match.group(1)
-            imports = match.group(2).strip()
-            for imp in imports.split(','):
-                imp = imp.strip()
-                if 'ViewSet' in imp:
-                    viewset_name = imp.split(' as ')[-1].strip()
-                    viewset_imports[viewset_name] = f"{module_path}.{imp.split(' as ')[0].strip()}"
-                    print(f"  Found ViewSet import: {viewset_name}")
+        viewset_imports = visitor.viewset_imports
+        for viewset_name in viewset_imports:
+            logger.debug("  Found ViewSet import: %s", viewset_name)
         
         # Handle Django REST Framework router patterns
         router_patterns = []
         
-        # Look for explicit router variable patterns like router = DefaultRouter()
-        router_match = re.search(r'(\w+)\s*=\s*(?:routers\.)?(?:Default)?Router', source_code)
-        
         # If no explicit router variable, look for common DRF router usage patterns
-        if not router_match:
+        if not visitor.routers:
             # Check for direct router.register calls without variable assignment
-            register_patterns = re.findall(r'(?:router|DefaultRouter\(\))\.register\([\'"]([^\'"]+)[\'"],\s*(\w+)', source_code)
+            register_patterns = [
+                (path, viewset) for router, path, viewset in visitor.registrations
+                if router in ('router', 'DefaultRouter()')
+            ]
             if register_patterns:
-                print(f"  Found DRF router register calls directly")
+                logger.debug("  Found DRF router register calls directly")
                 # Process each register call
                 for path, viewset in register_patterns:
-                    print(f"  Router registration: {path} -> {viewset}")
+                    logger.debug("  Router registration: %s -> %s", path, viewset)
                     # Normalize path - ensure it has no trailing slash except for root
                     normalized_path = path.rstrip('/') or '/'
                     
@@ -454,27 +934,27 @@ def extract_urls_from_file(file_path: str) -> List[Dict[str, Any]]:
                         # otherwise use our inferred endpoint name
                         if path == '/' or path == '' or path == model_name.lower() or path == pluralize(model_name.lower()):
                             better_path = f"api/{endpoint}"
-                            print(f"  Transforming generic path '{path}' to '{better_path}'")
+                            logger.debug("  Transforming generic path '%s' to '%s'", path, better_path)
                             normalized_path = better_path
                     
                     # Add list endpoint
-                    router_patterns.append({
-                        'path': normalized_path,
-                        'view': viewset,
-                        'name': f"{viewset}_list", 
-                        'namespace': None
-                    })
+                    router_patterns.append(URLPattern(
+                        path=normalized_path,
+                        view=viewset,
+                        name=f"{viewset}_list",
+                        namespace=None
+                    ))
                     # Add detail endpoint with proper path joining
-                    router_patterns.append({
-                        'path': join_paths(normalized_path, '{pk}'),
-                        'view': viewset,
-                        'name': f"{viewset}_detail",
-                        'namespace': None
-                    })
+                    router_patterns.append(URLPattern(
+                        path=join_paths(normalized_path, '{pk}'),
+                        view=viewset,
+                        name=f"{viewset}_detail",
+                        namespace=None
+                    ))
             
             # If no direct router.register calls, check for viewsets that appear to be used in routing
             elif viewset_imports and '/api/' in file_path:
-                print(f"  No router found but ViewSet imports detected in API urls file")
+                logger.debug("  No router found but ViewSet imports detected in API urls file")
                 for viewset_name in viewset_imports:
                     if viewset_name.endswith('ViewSet'):
                         # Extract model name from the ViewSet name
@@ -483,34 +963,36 @@ def extract_urls_from_file(file_path: str) -> List[Dict[str, Any]]:
                         # Convert model name to kebab-case endpoint
                         endpoint = model_name_to_endpoint(model_name)
                         
-                        print(f"  Inferring router registration for {viewset_name} at api/{endpoint}")
+                        logger.debug("  Inferring router registration for %s at api/%s", viewset_name, endpoint)
                         # Add list endpoint
-                        router_patterns.append({
-                            'path': f"api/{endpoint}",
-                            'view': viewset_name,
-                            'name': f"{viewset_name}_list",
-                            'namespace': None
-                        })
+                        router_patterns.append(URLPattern(
+                            path=f"api/{endpoint}",
+                            view=viewset_name,
+                            name=f"{viewset_name}_list",
+                            namespace=None
+                        ))
                         # Add detail endpoint with proper path joining
-                        router_patterns.append({
-                            'path': join_paths(f"api/{endpoint}", '{pk}'),
-                            'view': viewset_name,
-                            'name': f"{viewset_name}_detail",
-                            'namespace': None
-                        })
+                        router_patterns.append(URLPattern(
+                            path=join_paths(f"api/{endpoint}", '{pk}'),
+                            view=viewset_name,
+                            name=f"{viewset_name}_detail",
+                            namespace=None
+                        ))
         else:
             # Process explicit router variable patterns
-            router_name = router_match.group(1)
-            print(f"  Found DRF router '{router_name}' in {file_path}")
+            router_name = visitor.routers[0]
+            logger.debug("  Found DRF router '%s' in %s", router_name, file_path)
             
-            # Extract router.register patterns with better regex
-            register_patterns = re.findall(
-                rf'{router_name}\.register\([\'"]([^\'"]+)[\'"],\s*(\w+)', source_code)
+            # Extract the register() calls made on this router
+            register_patterns = [
+                (path, viewset) for router, path, viewset in visitor.registrations
+                if router == router_name
+            ]
             
             if register_patterns:
-                print(f"  Found {len(register_patterns)} router registrations")
+                logger.debug("  Found %s router registrations", len(register_patterns))
                 for path, viewset in register_patterns:
-                    print(f"  Router registration: {path} -> {viewset}")
+                    logger.debug("  Router registration: %s -> %s", path, viewset)
                     
                     # Normalize path - ensure it has no trailing slash except for root
                     normalized_path = path.rstrip('/') or '/'
@@ -518,357 +1000,426 @@ def extract_urls_from_file(file_path: str) -> List[Dict[str, Any]]:
                     # Try to determine viewset actions from imports or common patterns
                     custom_actions = []
                     
-                    # Look for @action decorators
-                    action_pattern = re.compile(rf'{viewset}.*?@action.*?def\s+(\w+)', re.DOTALL)
-                    action_matches = action_pattern.findall(source_code)
+                    # Look for @action decorators on the viewset if it is defined here
+                    action_matches = visitor.actions.get(viewset, [])
                     
                     # If not found, check if the viewset is imported and look in the source file 
                     if not action_matches and viewset in viewset_imports:
-                        imported_path = viewset_imports[viewset]
-                        module_parts = imported_path.split('.')
-                        viewset_file = None
+                        # The imported class name, without its module path
+                        viewset_class = viewset_imports[viewset].rpartition('.')[2]
                         
                         # Try to find the file that contains the ViewSet
-                        for root, dirs, files in os.walk(os.path.dirname(file_path)):
-                            for filename in files:
-                                if filename.endswith('.py') and module_parts[-1].lower() in filename.lower():
-                                    viewset_file = os.path.join(root, filename)
-                                    break
-                            if viewset_file:
-                                break
+                        viewset_file = _find_py_file(os.path.dirname(file_path), viewset_class)
                         
                         if viewset_file:
                             try:
-                                with open(viewset_file, 'r') as vf:
-                                    viewset_code = vf.read()
-                                    # Look for custom actions
-                                    action_matches = re.findall(r'@action.*?def\s+(\w+)', viewset_code, re.DOTALL)
-                                    if action_matches:
-                                        print(f"  Found custom actions in {viewset}: {', '.join(action_matches)}")
+                                # Look for custom actions
+                                viewset_visitor = DjangoURLPatternVisitor()
+                                viewset_visitor.visit(_parse_source_file(viewset_file))
+                                action_matches = viewset_visitor.actions.get(viewset_class, [])
+                                if action_matches:
+                                    logger.debug("  Found custom actions in %s: %s", viewset, ', '.join(action_matches))
                             except Exception as e:
-                                print(f"  Error reading viewset file: {e}")
+                                logger.warning("  Error reading viewset file: %s", e)
                     
                     # Create standard viewset routes
                     # Add list endpoint
-                    router_patterns.append({
-                        'path': normalized_path,
-                        'view': viewset,
-                        'name': f"{viewset}_list",
-                        'namespace': None
-                    })
+                    router_patterns.append(URLPattern(
+                        path=normalized_path,
+                        view=viewset,
+                        name=f"{viewset}_list",
+                        namespace=None
+                    ))
                     
                     # Add detail endpoint with proper path joining
-                    router_patterns.append({
-                        'path': join_paths(normalized_path, '{pk}'),
-                        'view': viewset,
-                        'name': f"{viewset}_detail",
-                        'namespace': None
-                    })
+                    router_patterns.append(URLPattern(
+                        path=join_paths(normalized_path, '{pk}'),
+                        view=viewset,
+                        name=f"{viewset}_detail",
+                        namespace=None
+                    ))
                     
                     # Add custom action endpoints if found
                     for action in action_matches:
                         # Check for common patterns in action names to guess if it's detail or list
-                        is_detail = any(detail_word in action for detail_word in 
-                                      ['delete', 'edit', 'update', 'get_', 'set_', 'by_id'])
+                        is_detail = any(detail_word in action for detail_word in _DETAIL_ACTION_WORDS)
                         
                         if is_detail:
-                            router_patterns.append({
-                                'path': join_paths(join_paths(normalized_path, '{pk}'), action),
-                                'view': viewset,
-                                'name': f"{viewset}_{action}",
-                                'namespace': None
-                            })
+                            router_patterns.append(URLPattern(
+                                path=join_paths(join_paths(normalized_path, '{pk}'), action),
+                                view=viewset,
+                                name=f"{viewset}_{action}",
+                                namespace=None
+                            ))
                         else:
-                            router_patterns.append({
-                                'path': join_paths(normalized_path, action),
-                                'view': viewset,
-                                'name': f"{viewset}_{action}",
-                                'namespace': None
-                            })
+                            router_patterns.append(URLPattern(
+                                path=join_paths(normalized_path, action),
+                                view=viewset,
+                                name=f"{viewset}_{action}",
+                                namespace=None
+                            ))
             else:
-                print("  No router.register() calls found despite router being defined")
+                logger.debug("  No router.register() calls found despite router being defined")
         
         # Look for various URL pattern styles
         
         # 1. Django 2.0+ path() style
-        path_patterns = re.findall(r'path\([\'"]([^\'"]*)[\'"],\s*([^),]+)', source_code)
-        for path, view in path_patterns:
+        for path, view_name, include_info in visitor.route_calls:
             # Skip admin, static, media paths
-            if any(skip in path for skip in ['admin', 'static', 'media']):
+            if _SKIP_PATH_RE.search(path):
                 continue
                 
-            # Handle include() patterns
-            if 'include' in view:
-                include_match = re.search(r'include\([\'"]([^\'"]+)[\'"]', view)
-                if include_match:
-                    included_app = include_match.group(1)
-                    print(f"  Found include: {included_app} at {path}")
-                    # Process included patterns recursively
-                    include_info = {'include': included_app}
-                    included_patterns = process_included_urls(file_path, include_info)
-                    if included_patterns:
-                        # Prepend the parent path to all included patterns with proper path joining
-                        for pattern in included_patterns:
-                            pattern['path'] = join_paths(path, pattern['path'])
-                        patterns.extend(included_patterns)
-            else:
-                # Regular view pattern
-                view_name = view.strip()
-                # Extract the view name from expressions like views.my_view or MyViewClass.as_view()
-                view_match = re.search(r'(\w+)(?:\.as_view\(\)|$|\W)', view_name)
-                if view_match:
-                    view_name = view_match.group(1)
-                patterns.append({
-                    'path': path,
-                    'view': view_name,
-                    'name': None,
-                    'namespace': None
-                })
-        
-        # 2. Old-style url() patterns with regex
-        url_patterns = re.findall(r'url\(r[\'"]([^\'"]*)[\'"],\s*([^),]+)', source_code)
-        for path, view in url_patterns:
+            # Handle include() patterns; their routes are mounted under this path
+            if include_info:
+                logger.debug("  Found include: %s at %s", include_info['include'], path)
+                included_file = resolve_included_urls(file_path, include_info['include'])
+                if included_file:
+                    items.append((included_file, path, include_info['namespace'], False))
+            elif view_name:
+                # Regular view pattern; the visitor already reduced expressions like
+                # views.my_view or MyViewClass.as_view() to their leading name
+                items.append(URLPattern(
+                    path=path,
+                    view=view_name,
+                    name=None,
+                    namespace=None
+                ))
+        
+        # 2. Old-style url() and re_path() patterns with regex
+        for path, view_name, include_info in visitor.url_calls:
             # Convert regex patterns to path format (simplified)
-            path = re.sub(r'\(\?P<([^>]+)>[^)]+\)', r'{\1}', path)
+            path = _NAMED_GROUP_RE.sub(_NAMED_GROUP_SUB, path)
             
             # Handle include() in the same way
-            if 'include' in view:
-                include_match = re.search(r'include\([\'"]([^\'"]+)[\'"]', view)
-                if include_match:
-                    included_app = include_match.group(1)
-                    print(f"  Found include: {included_app} at {path}")
-                    include_info = {'include': included_app}
-                    included_patterns = process_included_urls(file_path, include_info)
-                    if included_patterns:
-                        for pattern in included_patterns:
-                            pattern['path'] = join_paths(path, pattern['path'])
-                        patterns.extend(included_patterns)
-            else:
-                view_name = view.strip()
-                view_match = re.search(r'(\w+)(?:\.as_view\(\)|$|\W)', view_name)
-                if view_match:
-                    view_name = view_match.group(1)
-                patterns.append({
-                    'path': path,
-                    'view': view_name,
-                    'name': None,
-                    'namespace': None
-                })
+            if include_info:
+                logger.debug("  Found include: %s at %s", include_info['include'], path)
+                included_file = resolve_included_urls(file_path, include_info['include'])
+                if included_file:
+                    items.append((included_file, path, include_info['namespace'], False))
+            elif view_name:
+                items.append(URLPattern(
+                    path=path,
+                    view=view_name,
+                    name=None,
+                    namespace=None
+                ))
         
         # Add router patterns 
         if router_patterns:
-            print(f"  Adding {len(router_patterns)} router patterns")
-            patterns.extend(router_patterns)
+            logger.debug("  Adding %s router patterns", len(router_patterns))
+            items.extend(router_patterns)
         
         # Look for additional API URL patterns
-        api_prefix_match = re.search(r'path\([\'"]api/?[\'"]', source_code)
-        if api_prefix_match:
-            print("  Found API URL prefix, looking for nested API endpoints")
+        if visitor.has_api_prefix:
+            logger.debug("  Found API URL prefix, looking for nested API endpoints")
             api_dir = os.path.dirname(file_path)
-            for root, dirs, files in os.walk(api_dir):
-                for file in files:
-                    if file == 'urls.py' and os.path.join(root, file) != file_path:
-                        api_urls_path = os.path.join(root, file)
-                        print(f"  Checking nested API urls in {api_urls_path}")
-                        try:
-                            sub_patterns = extract_urls_from_file(api_urls_path)
-                            if sub_patterns:
-                                print(f"  Found {len(sub_patterns)} nested API patterns")
-                                # Prefix all patterns with /api using proper path joining
-                                for pattern in sub_patterns:
-                                    pattern['path'] = join_paths('api', pattern['path'].lstrip('/'))
-                                patterns.extend(sub_patterns)
-                        except Exception as e:
-                            print(f"  Error processing {api_urls_path}: {e}")
-        
-        if patterns:
-            print(f"  Found {len(patterns)} URL patterns")
-            for pattern in patterns[:5]:  # Show just the first 5 to avoid verbose output
-                print(f"    - {pattern['path']} -> {pattern['view']}")
-            if len(patterns) > 5:
-                print(f"    - ... and {len(patterns) - 5} more")
-                
-        return patterns
+            for api_urls_path in _find_urls_py(api_dir):
+                if api_urls_path != file_path:
+                    logger.debug("  Queueing nested API urls in %s", api_urls_path)
+                    # Prefix all of its patterns with /api using proper path joining
+                    items.append((api_urls_path, 'api', None, True))
+        
+        _URL_PATTERN_CACHE[file_key] = items
+        return items
     except Exception as e:
-        print(f"Error analyzing URLs file {file_path}: {e}")
+        logger.error("Error analyzing URLs file %s: %s", file_path, e)
         return []
 
 
-def process_included_urls(parent_file: str, include_info: Dict[str, Any]) -> List[Dict[str, Any]]:
-    """Process included URL patterns."""
+def _disk_key(extract, file_key: Tuple[str, int, int]) -> Tuple[str, str, int, int]:
+    return (extract.__name__, os.path.abspath(file_key[0])) + file_key[1:]
+
+
+def _disk_cached(extract, file_key: Tuple[str, int, int]) -> Optional[Dict[str, Any]]:
+    """Return the result a previous run stored for this version of the file, or None."""
+    if _DISK_CACHE is None or extract.__name__ not in _PERSISTENT_EXTRACTS:
+        return None
+    disk_key = _disk_key(extract, file_key)
+    result = _DISK_CACHE.get(disk_key)
+    if result is not None:
+        _DISK_CACHE_USED[disk_key] = result
+    return result
+
+
+def _remember(extract, file_key: Tuple[str, int, int], result: Dict[str, Any]) -> None:
+    """Queue a fresh result for store_extract_cache."""
+    if _DISK_CACHE is not None and extract.__name__ in _PERSISTENT_EXTRACTS:
+        _DISK_CACHE_USED[_disk_key(extract, file_key)] = result
+
+
+def _extract_cache_file(project_root: str) -> str:
+    key = os.path.abspath(project_root)
+    return os.path.join(_EXTRACT_CACHE_DIR, hashlib.sha256(key.encode()).hexdigest() + ".pkl")
+
+
+def load_extract_cache(project_root: str) -> None:
+    """Enable the on-disk extraction cache, seeded from the last run over project_root."""
+    global _DISK_CACHE
+    _DISK_CACHE = {}
     try:
-        include_path = include_info['include']
-        namespace = include_info.get('namespace')
-        
-        # Handle relative imports based on parent file location
-        parent_dir = os.path.dirname(parent_file)
-        
-        # Convert Django dotted path to file path
-        if include_path.endswith('.urls'):
-            module_parts = include_path.split('.')
-            file_path = os.path.join(parent_dir, *module_parts[:-1], f"{module_parts[-1]}.py")
+        with open(_extract_cache_file(project_root), "rb") as f:
+            version, entries = pickle.load(f)
+        if version == os.path.getmtime(__file__):
+            _DISK_CACHE = entries
+    except Exception:
+        pass
+
+
+def store_extract_cache(project_root: str) -> None:
+    """Best-effort write of the extractions this run used, which drops outdated entries."""
+    if _DISK_CACHE is None:
+        return
+    hits = sum(1 for disk_key in _DISK_CACHE_USED if disk_key in _DISK_CACHE)
+    logger.debug("Extraction cache: %s hits, %s misses", hits, len(_DISK_CACHE_USED) - hits)
+    try:
+        cache_file = _extract_cache_file(project_root)
+        os.makedirs(_EXTRACT_CACHE_DIR, exist_ok=True)
+        tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+        with open(tmp_file, "wb") as f:
+            pickle.dump((os.path.getmtime(__file__), _DISK_CACHE_USED), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass
+
+
+# Below this many uncached files, worker start-up costs more than parallel parsing saves
+_PARALLEL_SCAN_MIN = 8
+_SCAN_POOL: Optional[concurrent.futures.ProcessPoolExecutor] = None
+
+
+def _run_scan(scan, file_path: str):
+    """Worker entry point; a failing file is left for the in-process call to report."""
+    try:
+        return scan(file_path)
+    except Exception:
+        return None
+
+
+def _prefetch(scan, cache: Dict[Tuple[str, int, int], Any], file_paths: List[str]) -> None:
+    """Run scan over many files in worker processes and seed its per-file cache with the results."""
+    global _SCAN_POOL
+    pending = []
+    for file_path in dict.fromkeys(file_paths):
+        try:
+            file_key = _file_key(file_path)
+        except OSError:
+            continue
+        if file_key not in cache:
+            persisted = _disk_cached(scan, file_key)
+            if persisted is not None:
+                cache[file_key] = persisted
+            else:
+                pending.append(file_key)
+    if len(pending) < _PARALLEL_SCAN_MIN or (os.cpu_count() or 1) < 2:
+        return
+    try:
+        if _SCAN_POOL is None:
+            _SCAN_POOL = concurrent.futures.ProcessPoolExecutor()
+        results = _SCAN_POOL.map(functools.partial(_run_scan, scan),
+                                 [file_key[0] for file_key in pending], chunksize=4)
+        for file_key, result in zip(pending, results):
+            if result is not None:
+                cache[file_key] = result
+                _remember(scan, file_key, result)
+    except (OSError, concurrent.futures.process.BrokenProcessPool) as e:
+        # No usable worker processes here; the files are scanned in-process on demand
+        logger.debug("  Parallel scan unavailable: %s", e)
+
+
+def _include_refs(items: List[Union[URLPattern, _IncludeRef]]) -> List[str]:
+    """Return the urls files referenced by a scan, for prefetching."""
+    return [item[0] for item in items if not isinstance(item, URLPattern)]
+
+
+def extract_urls_from_file(file_path: str) -> List[URLPattern]:
+    """Extract URL patterns from a Django URLs file and the urls files it includes.
+    
+    Includes are followed with an explicit depth-first stack instead of recursion, so
+    included routes still appear where their include() does, while deep or circular
+    include chains cannot exhaust the interpreter stack.
+    """
+    patterns = []
+    real_path = os.path.realpath(file_path)
+    root_items = _scan_urls_file(file_path)
+    _prefetch(_scan_urls_file, _URL_PATTERN_CACHE, _include_refs(root_items))
+    # Frames of (remaining items, real path, include transforms from innermost outwards)
+    stack = [(iter(root_items), real_path, ())]
+    on_chain = {real_path}
+    while stack:
+        items, real_path, transforms = stack[-1]
+        item = next(items, None)
+        if item is None:
+            stack.pop()
+            on_chain.discard(real_path)
+        elif isinstance(item, URLPattern):
+            # Scans are cached, so every emitted pattern is a fresh copy
+            pattern = dataclasses.replace(item)
+            for prefix, namespace, strip_slash in transforms:
+                pattern.path = join_paths(prefix, pattern.path.lstrip('/') if strip_slash else pattern.path)
+                if namespace:
+                    pattern.namespace = namespace
+            patterns.append(pattern)
         else:
-            # Handle app-level URLs
-            file_path = os.path.join(parent_dir, include_path, 'urls.py')
-            
-        if not os.path.exists(file_path):
-            # Try a different approach for app-level URLs
-            if '.' in include_path:
-                module_parts = include_path.split('.')
-                file_path = os.path.join(parent_dir, *module_parts[:-1], f"{module_parts[-1]}.py")
-                
-        if os.path.exists(file_path):
-            sub_patterns = extract_urls_from_file(file_path)
-            
-            # Add namespace to patterns if provided
-            if namespace:
-                for pattern in sub_patterns:
-                    pattern['namespace'] = namespace
-                    
-            return sub_patterns
-    except Exception as e:
-        print(f"Error processing included URLs: {e}")
+            included_file, prefix, namespace, strip_slash = item
+            included_real = os.path.realpath(included_file)
+            if included_real in on_chain:
+                logger.info("  Skipping circular include of %s", included_file)
+                continue
+            on_chain.add(included_real)
+            included_items = _scan_urls_file(included_file)
+            _prefetch(_scan_urls_file, _URL_PATTERN_CACHE, _include_refs(included_items))
+            stack.append((iter(included_items), included_real,
+                          ((prefix, namespace, strip_slash),) + transforms))
     
-    return []
+    if patterns:
+        logger.info("  Found %s URL patterns", len(patterns))
+        if logger.isEnabledFor(logging.DEBUG):
+            for pattern in patterns[:5]:  # Show just the first 5 to avoid verbose output
+                logger.debug("    - %s -> %s", pattern.path, pattern.view)
+            if len(patterns) > 5:
+                logger.debug("    - ... and %s more", len(patterns) - 5)
+            
+    return patterns
+
+
+def _cached_extract(extract, cache: Dict[Tuple[str, int, int], Dict[str, Any]], file_path: str) -> Dict[str, Any]:
+    """Return extract(file_path) for the file's current version; results are shared, not copied."""
+    file_key = _file_key(file_path)
+    result = cache.get(file_key)
+    if result is None:
+        result = _disk_cached(extract, file_key)
+        if result is None:
+            result = extract(file_path)
+            _remember(extract, file_key, result)
+        cache[file_key] = result
+    return result
+
+
+def _extract_views(file_path: str) -> Dict[str, Any]:
+    """Run the ViewSet visitor over a file."""
+    tree = _parse_source_file(file_path)
+    viewset_visitor = DjangoViewSetVisitor()
+    viewset_visitor.visit(tree)
+    return viewset_visitor.viewsets
 
 
 def extract_views_from_file(file_path: str) -> Dict[str, Any]:
     """Extract view classes and functions from a file."""
     try:
-        with open(file_path, 'r') as f:
-            source_code = f.read()
-            
-        tree = ast.parse(source_code)
-        viewset_visitor = DjangoViewSetVisitor()
-        viewset_visitor.visit(tree)
-        
-        return viewset_visitor.viewsets
+        return _cached_extract(_extract_views, _VIEWS_CACHE, file_path)
     except Exception as e:
         print(f"Error analyzing views file: {e}")
         return {}
 
 
+def _extract_models(file_path: str) -> Dict[str, Any]:
+    """Run the model visitor over a file."""
+    tree = _parse_source_file(file_path)
+    model_visitor = DjangoModelVisitor()
+    model_visitor.visit(tree)
+    
+    # Process model data to extract more information
+    processed_models = {}
+    for model_name, model_info in model_visitor.models.items():
+        fields = {}
+        relationships = []
+        processed = processed_models[model_name] = {
+            'fields': fields,
+            'validations': model_info['validations'],
+            'relationships': relationships
+        }
+        
+        for field_name, field_type in model_info['fields'].items():
+            # Map Django field types to OpenAPI types (map_django_field_type_to_openapi, inlined)
+            fields[field_name] = _DJANGO_TO_OPENAPI.get(field_type, 'string')
+            
+            # Check for relationship fields and track them
+            if field_type in _RELATION_FIELDS:
+                relationships.append({
+                    'field': field_name,
+                    'type': field_type
+                })
+        
+        # Add documentation if available
+        if model_info['doc']:
+            processed['description'] = model_info['doc']
+    
+    return processed_models
+
+
 def extract_models_from_file(file_path: str) -> Dict[str, Any]:
     """Extract model classes from a file."""
     try:
-        with open(file_path, 'r') as f:
-            source_code = f.read()
-            
-        tree = ast.parse(source_code)
-        model_visitor = DjangoModelVisitor()
-        model_visitor.visit(tree)
-        
-        # Process model data to extract more information
-        processed_models = {}
-        for model_name, model_info in model_visitor.models.items():
-            processed_models[model_name] = {
-                'fields': {},
-                'validations': {},
-                'relationships': []
-            }
-            
-            for field_name, field_type in model_info['fields'].items():
-                # Map Django field types to OpenAPI types
-                openapi_type = map_django_field_type_to_openapi(field_type)
-                processed_models[model_name]['fields'][field_name] = openapi_type
-                
-                # Check for relationship fields and track them
-                if field_type in ['ForeignKey', 'OneToOneField', 'ManyToManyField']:
-                    processed_models[model_name]['relationships'].append({
-                        'field': field_name,
-                        'type': field_type
-                    })
-            
-            # Add documentation if available
-            if model_info['doc']:
-                processed_models[model_name]['description'] = model_info['doc']
-        
-        # Try to extract additional field information from the source code
-        for model_name in processed_models:
-            model_pattern = re.compile(rf'class\s+{model_name}\s*\(.*?\):.*?(?=class|\Z)', re.DOTALL)
-            model_match = model_pattern.search(source_code)
-            
-            if model_match:
-                model_code = model_match.group(0)
-                
-                # Look for field validations
-                required_fields = re.findall(r'validators=\[.*?validate_required.*?\]', model_code)
-                for req_field in required_fields:
-                    field_match = re.search(r'(\w+)\s*=\s*models\.\w+\(.*?validators=\[.*?validate_required.*?\]', model_code)
-                    if field_match:
-                        field_name = field_match.group(1)
-                        processed_models[model_name]['validations'][field_name] = {'required': True}
-                
-                # Look for explicit required=True in field definitions
-                required_fields = re.findall(r'(\w+)\s*=\s*models\.\w+\(.*?null\s*=\s*False.*?\)', model_code)
-                for field_name in required_fields:
-                    processed_models[model_name]['validations'][field_name] = {'required': True}
-                
-                # Look for max_length constraints
-                max_length_fields = re.findall(r'(\w+)\s*=\s*models\.\w+\(.*?max_length\s*=\s*(\d+).*?\)', model_code)
-                for field_name, max_length in max_length_fields:
-                    if field_name not in processed_models[model_name]['validations']:
-                        processed_models[model_name]['validations'][field_name] = {}
-                    processed_models[model_name]['validations'][field_name]['max_length'] = int(max_length)
-        
-        return processed_models
+        return _cached_extract(_extract_models, _MODELS_CACHE, file_path)
     except Exception as e:
         print(f"Error analyzing models file: {e}")
         return {}
 
 
+# Common Django field types -> OpenAPI types
+_DJANGO_TO_OPENAPI: Dict[str, str] = {
+    'CharField': 'string',
+    'TextField': 'string',
+    'EmailField': 'string',
+    'URLField': 'string',
+    'SlugField': 'string',
+    'UUIDField': 'string',
+    'FileField': 'string',
+    'ImageField': 'string',
+    'BooleanField': 'boolean',
+    'NullBooleanField': 'boolean',
+    'IntegerField': 'integer',
+    'PositiveIntegerField': 'integer',
+    'PositiveSmallIntegerField': 'integer',
+    'SmallIntegerField': 'integer',
+    'BigIntegerField': 'integer',
+    'FloatField': 'number',
+    'DecimalField': 'number',
+    'DateField': 'string',
+    'TimeField': 'string',
+    'DateTimeField': 'string',
+    'DurationField': 'string',
+    'JSONField': 'object',
+    'ForeignKey': 'integer', # Simplified, typically an ID reference
+    'OneToOneField': 'integer', # Simplified, typically an ID reference
+    'ManyToManyField': 'array', # Simplified, typically an array of IDs
+}
+
+
 def map_django_field_type_to_openapi(django_field_type):
     """Map Django field types to OpenAPI schema types."""
-    # Map common Django field types to OpenAPI types
-    field_type_mapping = {
-        'CharField': 'string',
-        'TextField': 'string',
-        'EmailField': 'string',
-        'URLField': 'string',
-        'SlugField': 'string',
-        'UUIDField': 'string',
-        'FileField': 'string',
-        'ImageField': 'string',
-        'BooleanField': 'boolean',
-        'NullBooleanField': 'boolean',
-        'IntegerField': 'integer',
-        'PositiveIntegerField': 'integer',
-        'PositiveSmallIntegerField': 'integer',
-        'SmallIntegerField': 'integer',
-        'BigIntegerField': 'integer',
-        'FloatField': 'number',
-        'DecimalField': 'number',
-        'DateField': 'string',
-        'TimeField': 'string',
-        'DateTimeField': 'string',
-        'DurationField': 'string',
-        'JSONField': 'object',
-        'ForeignKey': 'integer', # Simplified, typically an ID reference
-        'OneToOneField': 'integer', # Simplified, typically an ID reference
-        'ManyToManyField': 'array', # Simplified, typically an array of IDs
-    }
-    
     # Return the mapped type or default to string if not found
-    return field_type_mapping.get(django_field_type, 'string')
+    return _DJANGO_TO_OPENAPI.get(django_field_type, 'string')
+
+
+@functools.lru_cache(maxsize=None)
+def _definition_index(project_root: str) -> Dict[str, str]:
+    """Map each class and function name under project_root to the first file defining it."""
+    index = {}
+    for entry in _iter_files(project_root, _SKIP_DIRS):
+        if not entry.name.endswith('.py'):
+            continue
+        try:
+            tree = _parse_source_file(entry.path)
+        except Exception:
+            continue
+        for node in ast.walk(tree):
+            if isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+                index.setdefault(node.name, entry.path)
+    return index
 
 
 def find_views_file(project_root: str, view_name: str) -> Optional[str]:
     """Find the file containing a view class or function."""
-    for root, _, files in os.walk(project_root):
-        for file in files:
-            if file.endswith('.py'):
-                file_path = os.path.join(root, file)
-                try:
-                    with open(file_path, 'r') as f:
-                        content = f.read()
-                        
-                    if re.search(rf'class\s+{view_name}\b', content) or re.search(rf'def\s+{view_name}\b', content):
-                        return file_path
-                except Exception:
-                    pass
-    return None
+    return _definition_index(project_root).get(view_name)
+
 
+# CamelCase word boundaries: before a capitalised word, and between a lower/digit and a capital
+_CAMEL_WORD_RE = re.compile('(.)([A-Z][a-z]+)')
+_CAMEL_BOUNDARY_RE = re.compile('([a-z0-9])([A-Z])')
 
+
+@functools.lru_cache(maxsize=None)
 def model_name_to_endpoint(model_name):
     """
     Convert model name to appropriate RESTful endpoint name.
@@ -876,57 +1427,72 @@ def model_name_to_endpoint(model_name):
     """
     # Convert CamelCase to kebab-case first
     # e.g. UserProfile -> user-profile
-    s1 = re.sub('(.)([A-Z][a-z]+)', r'\1-\2', model_name)
-    kebab = re.sub('([a-z0-9])([A-Z])', r'\1-\2', s1).lower()
+    s1 = _CAMEL_WORD_RE.sub(r'\1-\2', model_name)
+    kebab = _CAMEL_BOUNDARY_RE.sub(r'\1-\2', s1).lower()
     
     # Then pluralize
     return pluralize(kebab)
 
 
+# Standard ModelViewSet actions and how a synthetic viewset describes them
+_SYNTHETIC_METHOD_DESCRIPTIONS = (
+    ('list', 'List all {}s'),
+    ('create', 'Create a new {}'),
+    ('retrieve', 'Get a single {}'),
+    ('update', 'Update a {}'),
+    ('partial_update', 'Partially update a {}'),
+    ('destroy', 'Delete a {}'),
+)
+_MODELVIEWSET_BASES = ['ModelViewSet']
+
+
+def _synthetic_viewset(model_lower: str) -> Dict[str, Any]:
+    """Describe the ModelViewSet a model would get if the project declared one."""
+    return {
+        'base_classes': _MODELVIEWSET_BASES,
+        'methods': {
+            action: {'http_method': _ACTION_HTTP_METHODS[action], 'description': description.format(model_lower)}
+            for action, description in _SYNTHETIC_METHOD_DESCRIPTIONS
+        }
+    }
+
+
 def analyze_django_project(project_root: str) -> Dict[str, Any]:
     """Analyze a Django project to extract routes, views, and models."""
     project_data = {
         'urls': [],
         'views': {},
         'models': {},
-        'app_name': os.path.basename(project_root)
+        'app_name': os.path.basename(project_root),
+        'files': {}
     }
     
-    # Keep track of endpoints we've already added to avoid duplicates
-    added_endpoints = set()
+    # Keep track of (path, view) endpoints we've already added to avoid duplicates
+    added_endpoints: Set[Tuple[str, str]] = set()
     
     print(f"\n1. Analyzing Django project structure...")
     
-    # Find all urls.py files
-    urls_files = []
-    for root, dirs, files in os.walk(project_root):
-        if 'urls.py' in files:
-            file_path = os.path.join(root, 'urls.py')
-            urls_files.append(file_path)
-            # Quick check if this contains API endpoints (for better diagnosis)
-            try:
-                with open(file_path, 'r') as f:
-                    content = f.read()
-                    if any(api_marker in content for api_marker in 
-                          ['rest_framework', 'router', 'api', 'viewsets', 'APIView']):
-                        print(f"   Found potential API definitions in {file_path}")
-            except Exception:
-                pass
+    # One walk finds the urls.py files and classifies every other module
+    project_files = project_data['files'] = _scan_project(project_root)
+    urls_files = project_files['urls']
     
     print(f"   Found {len(urls_files)} urls.py files")
     
+    # Files whose patterns are already in project_data['urls']
+    processed: Set[str] = set()
+    
     # First specifically look for api/urls.py if it exists - this commonly contains REST endpoints
-    api_urls = None
     for file in urls_files:
         if '/api/urls.py' in file or '/apis/urls.py' in file:
             api_urls = file
+            processed.add(api_urls)
             print(f"   Found API URLs file: {api_urls}")
             api_patterns = extract_urls_from_file(api_urls)
             if api_patterns:
                 # Prefix API paths if not already done
                 for pattern in api_patterns:
-                    if not pattern['path'].startswith('api/') and not pattern['path'].startswith('/api/'):
-                        pattern['path'] = f"api/{pattern['path'].lstrip('/')}"
+                    if not pattern.path.startswith(_API_PREFIXES):
+                        pattern.path = 'api/' + pattern.path.lstrip('/')
                 project_data['urls'].extend(api_patterns)
             
     # Start with the main urls.py file (prioritize project-level urls.py)
@@ -943,6 +1509,7 @@ def analyze_django_project(project_root: str) -> Dict[str, Any]:
         print(f"   Falling back to: {main_urls}")
         
     if main_urls:
+        processed.add(main_urls)
         main_patterns = extract_urls_from_file(main_urls)
         if main_patterns:
             project_data['urls'].extend(main_patterns)
@@ -954,57 +1521,29 @@ def analyze_django_project(project_root: str) -> Dict[str, Any]:
     if not project_data['urls']:
         print("   No URL patterns found in main files, checking all urls.py files...")
         for file in urls_files:
-            if file != main_urls and file != api_urls:  # Skip already processed files
-                patterns = extract_urls_from_file(file)
-                if patterns:
-                    # Try to determine if these are API endpoints from the file path
-                    if 'api' in file.lower():
-                        for pattern in patterns:
-                            if not pattern['path'].startswith('api/'):
-                                pattern['path'] = f"api/{pattern['path'].lstrip('/')}"
-                    project_data['urls'].extend(patterns)
+            if file in processed:
+                continue
+            patterns = extract_urls_from_file(file)
+            if patterns:
+                # Try to determine if these are API endpoints from the file path
+                if 'api' in file.lower():
+                    for pattern in patterns:
+                        if not pattern.path.startswith(_API_PREFIXES):
+                            pattern.path = 'api/' + pattern.path.lstrip('/')
+                project_data['urls'].extend(patterns)
     
     # Find all models and views
     print(f"\n2. Looking for views and models...")
-    view_files = []
-    model_files = []
-    viewset_files = []
-    serializer_files = []
+    view_files = project_files['views']
+    model_files = project_files['models']
+    viewset_files = project_files['viewsets']
+    serializer_files = project_files['serializers']
     
-    for root, dirs, files in os.walk(project_root):
-        for file in files:
-            if file.endswith('.py'):
-                file_path = os.path.join(root, file)
-                
-                # Skip migrations, __pycache__, and tests
-                if any(skip in file_path for skip in ['migrations', '__pycache__', 'tests']):
-                    continue
-                
-                # Try to determine file type by examining content
-                try:
-                    with open(file_path, 'r') as f:
-                        content = f.read()
-                    
-                    # Check for model indicators
-                    if file == 'models.py' or 'models.Model' in content or 'db.models' in content:
-                        model_files.append(file_path)
-                        
-                    # Check for viewset indicators  
-                    if 'ViewSet' in content or 'ModelViewSet' in content:
-                        viewset_files.append(file_path)
-                        
-                    # Check for view indicators
-                    if file == 'views.py' or 'View' in content or 'APIView' in content:
-                        view_files.append(file_path)
-                    
-                    # Check for serializer indicators
-                    if file == 'serializers.py' or 'Serializer' in content:
-                        serializer_files.append(file_path)
-                        
-                except Exception as e:
-                    print(f"   Warning: Couldn't read {file_path}: {e}")
-                    
     print(f"   Found {len(model_files)} model files, {len(view_files)} view files, and {len(viewset_files)} viewset files")
+    
+    # Large projects parse their model and view modules in worker processes
+    _prefetch(_extract_models, _MODELS_CACHE, model_files)
+    _prefetch(_extract_views, _VIEWS_CACHE, viewset_files + view_files)
                     
     # Extract from model files
     for file_path in model_files:
@@ -1035,7 +1574,7 @@ def analyze_django_project(project_root: str) -> Dict[str, Any]:
     def add_endpoint_if_not_exists(path, view, name=None, namespace=None):
         """Helper to add an endpoint only if it doesn't already exist"""
         # Check if we already have this endpoint
-        endpoint_key = f"{path}:{view}"
+        endpoint_key = (path, view)
         if endpoint_key in added_endpoints:
             return False
             
@@ -1043,22 +1582,22 @@ def analyze_django_project(project_root: str) -> Dict[str, Any]:
         added_endpoints.add(endpoint_key)
         
         # Add to URLs
-        project_data['urls'].append({
-            'path': path,
-            'view': view,
-            'name': name,
-            'namespace': namespace
-        })
+        project_data['urls'].append(URLPattern(
+            path=path,
+            view=view,
+            name=name,
+            namespace=namespace
+        ))
         return True
     
     # Check if we have actual API endpoints or only documentation endpoints
     has_api_endpoints = False
     for pattern in project_data['urls']:
-        path = pattern.get('path', '')
+        path = pattern.path or ''
         if path.startswith('api/') or '/api/' in path:
             has_api_endpoints = True
             # Track this endpoint
-            added_endpoints.add(f"{path}:{pattern.get('view', '')}")
+            added_endpoints.add((path, pattern.view or ''))
             break
     
     # Use serializers to infer API endpoints if we only have documentation endpoints
@@ -1070,22 +1609,12 @@ def analyze_django_project(project_root: str) -> Dict[str, Any]:
                     content = f.read()
                     
                 # Extract model names from serializers to infer viewsets
-                serializer_models = re.findall(r'class\s+(\w+)Serializer', content)
+                serializer_models = _SERIALIZER_CLASS_RE.findall(content)
                 for model in serializer_models:
                     # Create a synthetic ViewSet for each model that has a serializer
                     print(f"   Inferring ViewSet for model {model} from serializer")
                     viewset_name = f"{model}ViewSet"
-                    project_data['views'][viewset_name] = {
-                        'base_classes': ['ModelViewSet'],
-                        'methods': {
-                            'list': {'http_method': 'get', 'description': f'List all {model.lower()}s'},
-                            'create': {'http_method': 'post', 'description': f'Create a new {model.lower()}'},
-                            'retrieve': {'http_method': 'get', 'description': f'Get a single {model.lower()}'},
-                            'update': {'http_method': 'put', 'description': f'Update a {model.lower()}'},
-                            'partial_update': {'http_method': 'patch', 'description': f'Partially update a {model.lower()}'},
-                            'destroy': {'http_method': 'delete', 'description': f'Delete a {model.lower()}'}
-                        }
-                    }
+                    project_data['views'][viewset_name] = _synthetic_viewset(model.lower())
                     
                     # Generate synthetic endpoints for this model using kebab-case
                     model_endpoint = model_name_to_endpoint(model)
@@ -1117,17 +1646,7 @@ def analyze_django_project(project_root: str) -> Dict[str, Any]:
             viewset_name = f"{model_name}ViewSet"
             if viewset_name not in project_data['views']:
                 # Create synthetic viewset
-                project_data['views'][viewset_name] = {
-                    'base_classes': ['ModelViewSet'],
-                    'methods': {
-                        'list': {'http_method': 'get', 'description': f'List all {model_name.lower()}s'},
-                        'create': {'http_method': 'post', 'description': f'Create a new {model_name.lower()}'},
-                        'retrieve': {'http_method': 'get', 'description': f'Get a single {model_name.lower()}'},
-                        'update': {'http_method': 'put', 'description': f'Update a {model_name.lower()}'},
-                        'partial_update': {'http_method': 'patch', 'description': f'Partially update a {model_name.lower()}'},
-                        'destroy': {'http_method': 'delete', 'description': f'Delete a {model_name.lower()}'}
-                    }
-                }
+                project_data['views'][viewset_name] = _synthetic_viewset(model_name.lower())
             
             print(f"   Adding synthetic endpoints for {model_name}: /api/{model_endpoint}/")
             # Add list/create endpoint
@@ -1143,6 +1662,9 @@ def analyze_django_project(project_root: str) -> Dict[str, Any]:
                 viewset_name,
                 f"{model_name.lower()}-detail"
             )
+    
+    # Sources no extractor asked for would otherwise outlive the analysis
+    _PRELOADED_SOURCES.clear()
                         
     print(f"\n3. Summary:")
     print(f"   - URL patterns: {len(project_data['urls'])}")
@@ -1152,6 +1674,21 @@ def analyze_django_project(project_root: str) -> Dict[str, Any]:
     return project_data
 
 
+def _split_path_params(path: str) -> Tuple[str, List[str]]:
+    """Return path with every parameter rewritten to {name}, and the names in order."""
+    # Both syntaxes contain '<' (the regex one as (?P<), so most static routes skip the regex
+    if '<' not in path:
+        return path, []
+    names = []
+    
+    def to_openapi(match):
+        name = match.group(1) or match.group(2)
+        names.append(name)
+        return '{' + name + '}'
+    
+    return _PATH_PARAM_RE.sub(to_openapi, path), names
+
+
 def convert_django_path_to_openapi(path: str) -> str:
     """Convert Django-style URL pattern to OpenAPI path format."""
     if not path:
@@ -1161,12 +1698,9 @@ def convert_django_path_to_openapi(path: str) -> str:
     if not path.startswith('/'):
         path = '/' + path
         
-    # Replace Django-style path parameters with OpenAPI style
-    # <int:pk> or <pk> to {pk}
-    openapi_path = re.sub(r'<(?:[^:]+:)?([^>]+)>', r'{\1}', path)
-    
-    # Handle regex patterns like (?P<pk>\d+) to {pk}
-    openapi_path = re.sub(r'\(\?P<([^>]+)>[^)]+\)', r'{\1}', openapi_path)
+    # Replace Django-style path parameters (<int:pk> or <pk>) and regex
+    # patterns like (?P<pk>\d+) with OpenAPI style {pk}, in one pass
+    openapi_path, _ = _split_path_params(path)
     
     # Remove trailing slashes for OpenAPI consistency
     if openapi_path.endswith('/') and len(openapi_path) > 1:
@@ -1179,8 +1713,74 @@ def convert_django_path_to_openapi(path: str) -> str:
     return openapi_path
 
 
-def generate_openapi_spec(project_path, output_file=None):
-    """Generate an OpenAPI specification for a Django project."""
+@functools.lru_cache(maxsize=None)
+def _schema_ref(model_name):
+    """The components $ref for a model, formatted once and then shared by every use."""
+    return f"#/components/schemas/{model_name}"
+
+
+def _field_schema(field_name, field_info, models_data):
+    """Return (schema, is_required) for one model field in generate_openapi_spec's schemas."""
+    # The type/format lookups are the module maps' .get, inlined for this per-field path
+    # Handle the case where field_info is a string (simple type) instead of a dictionary
+    if isinstance(field_info, str):
+        field_type = field_info
+        schema_field = {
+            "type": _OPENAPI_TYPE_MAP.get(field_type, 'string')
+        }
+    else:
+        field_type = field_info.get('type', 'string')
+        schema_field = {
+            "type": _OPENAPI_TYPE_MAP.get(field_type, 'string')
+        }
+        
+        # Add format if applicable
+        openapi_format = _OPENAPI_FORMATS.get(field_type)
+        if openapi_format:
+            schema_field["format"] = openapi_format
+        
+        # Add description if available
+        if 'help_text' in field_info:
+            schema_field["description"] = field_info['help_text']
+        
+        # Add enum values if choices are defined
+        if 'choices' in field_info:
+            schema_field["enum"] = [choice[0] for choice in field_info['choices']]
+    
+    # Handle relationship fields
+    if field_type in _RELATION_FIELDS:
+        related_model = None
+        if isinstance(field_info, dict):
+            related_model = field_info.get('related_model')
+        
+        if related_model and related_model in models_data:
+            if field_type == 'ManyToManyField':
+                schema_field = {
+                    "type": "array",
+                    "items": {
+                        "$ref": _schema_ref(related_model)
+                    }
+                }
+            else:
+                schema_field = {
+                    "$ref": _schema_ref(related_model)
+                }
+    
+    # Add to required fields if known to be required
+    # This is simplified since we don't have full field info in all cases
+    # (the id field is skipped as typically auto-generated)
+    is_required = (isinstance(field_info, dict) and not field_info.get('null', False)
+                   and not field_info.get('blank', False) and field_name != 'id')
+    return schema_field, is_required
+
+
+def generate_openapi_spec(project_path, output_file=None, project_data=None, pretty=False):
+    """
+    Generate an OpenAPI specification for a Django project. When the caller already
+    ran analyze_django_project, passing its result as project_data reuses that scan's
+    file list instead of walking the project again. The file is written compact
+    unless pretty is set.
+    """
     try:
         # Discover the project structure
         print(f"Analyzing Django project at {project_path}...")
@@ -1189,20 +1789,24 @@ def generate_openapi_spec(project_path, output_file=None):
         models_data = {}
         views_data = {}
         
-        for root, dirs, files in os.walk(project_path):
-            for file in files:
-                if file.endswith('.py'):
-                    filepath = os.path.join(root, file)
-                    
-                    # Extract models
-                    if file == 'models.py' or file.endswith('_models.py'):
-                        models = extract_models_from_file(filepath)
-                        models_data.update(models)
-                    
-                    # Extract views
-                    if file == 'views.py' or file.endswith('_views.py') or file.endswith('_viewsets.py'):
-                        views = extract_views_from_file(filepath)
-                        views_data.update(views)
+        if project_data and project_data.get('files'):
+            py_files = project_data['files']['py']
+        else:
+            py_files = [entry.path for entry in _iter_files(project_path, _PROJECT_SKIP_DIRS)
+                        if entry.name.endswith('.py')]
+        
+        for filepath in py_files:
+            file = os.path.basename(filepath)
+            
+            # Extract models
+            if file == 'models.py' or file.endswith('_models.py'):
+                models = extract_models_from_file(filepath)
+                models_data.update(models)
+            
+            # Extract views
+            if file == 'views.py' or file.endswith('_views.py') or file.endswith('_viewsets.py'):
+                views = extract_views_from_file(filepath)
+                views_data.update(views)
         
         print(f"Found {len(models_data)} models and {len(views_data)} views/viewsets")
         
@@ -1234,105 +1838,73 @@ def generate_openapi_spec(project_path, output_file=None):
                         "type": "http",
                         "scheme": "bearer"
                     }
+                },
+                # Error responses the synthetic operations reference instead of inlining
+                "responses": {
+                    "BadRequest": {"description": "Bad request"},
+                    "Unauthorized": {"description": "Unauthorized"},
+                    "NotFound": {"description": "Not found"},
+                    "NoContent": {"description": "No content"}
+                },
+                # The {id} path parameter of the synthetic detail operations
+                "parameters": {
+                    "IdPath": {
+                        "name": "id",
+                        "in": "path",
+                        "required": True,
+                        "schema": {
+                            "type": "integer",
+                            "format": "int64"
+                        }
+                    }
                 }
             }
         }
         
         # Generate schemas for models
         for model_name, model_info in models_data.items():
+            field_schemas = [
+                (field_name, _field_schema(field_name, field_info, models_data))
+                for field_name, field_info in model_info['fields'].items()
+            ]
             schema = {
                 "type": "object",
-                "properties": {},
-                "required": []
+                "properties": {field_name: schema_field for field_name, (schema_field, _) in field_schemas}
             }
             
-            for field_name, field_info in model_info['fields'].items():
-                # Handle the case where field_info is a string (simple type) instead of a dictionary
-                if isinstance(field_info, str):
-                    field_type = field_info
-                    schema_field = {
-                        "type": convert_django_type_to_openapi(field_type)
-                    }
-                else:
-                    field_type = field_info.get('type', 'string')
-                    schema_field = {
-                        "type": convert_django_type_to_openapi(field_type)
-                    }
-                    
-                    # Add format if applicable
-                    openapi_format = get_openapi_format_for_field(field_type)
-                    if openapi_format:
-                        schema_field["format"] = openapi_format
-                    
-                    # Add description if available
-                    if 'help_text' in field_info:
-                        schema_field["description"] = field_info['help_text']
-                    
-                    # Add enum values if choices are defined
-                    if 'choices' in field_info:
-                        schema_field["enum"] = [choice[0] for choice in field_info['choices']]
-                
-                # Handle relationship fields
-                if field_type in ['ForeignKey', 'OneToOneField', 'ManyToManyField']:
-                    related_model = None
-                    if isinstance(field_info, dict):
-                        related_model = field_info.get('related_model')
-                    
-                    if related_model and related_model in models_data:
-                        if field_type == 'ManyToManyField':
-                            schema_field = {
-                                "type": "array",
-                                "items": {
-                                    "$ref": f"#/components/schemas/{related_model}"
-                                }
-                            }
-                        else:
-                            schema_field = {
-                                "$ref": f"#/components/schemas/{related_model}"
-                            }
-                
-                schema["properties"][field_name] = schema_field
-                
-                # Add to required fields if known to be required
-                # This is simplified since we don't have full field info in all cases
-                if isinstance(field_info, dict) and not field_info.get('null', False) and not field_info.get('blank', False):
-                    if field_name != 'id':  # Skip id field as typically auto-generated
-                        schema["required"].append(field_name)
-            
             # Only add required field if there are any required fields
-            if not schema["required"]:
-                del schema["required"]
+            required = [field_name for field_name, (_, is_required) in field_schemas if is_required]
+            if required:
+                schema["required"] = required
                 
             # Add the model schema to the OpenAPI spec
             openapi_spec["components"]["schemas"][model_name] = schema
         
+        # models_data and views_data are fixed from here on, so inference only
+        # depends on (path, view) and repeated pairs are answered from the cache
+        infer_model = functools.lru_cache(maxsize=4096)(functools.partial(
+            infer_model_from_path_or_view, available_models=models_data, views_data=views_data,
+            lower_models=_lowercase_names(models_data)))
+        
         # Add paths from URL patterns
         for url_pattern in urls_data:
-            path = url_pattern.get('path', '')
-            view = url_pattern.get('view', '')
+            path = url_pattern.path or ''
+            view = url_pattern.view or ''
             
             # Skip admin URLs
             if 'admin' in path:
                 continue
             
-            # Convert Django path parameters to OpenAPI parameters
-            path_params = []
-            openapi_path = path
-            
             # Convert Django URL parameters (like <int:pk>) to OpenAPI parameters ({pk})
-            pattern = r'<(?:[^:]+:)?([^>]+)>'
-            matches = re.findall(pattern, path)
-            
-            for param in matches:
-                path_params.append({
-                    "name": param,
-                    "in": "path",
-                    "required": True,
-                    "schema": {
-                        "type": "string"
-                    }
-                })
-                openapi_path = re.sub(r'<(?:[^:]+:)?' + param + '>', '{' + param + '}', openapi_path)
+            openapi_path, param_names = _split_path_params(path)
+            path_params = [{
+                "name": param,
+                "in": "path",
+                "required": True,
+                "schema": {
+                    "type": "string"
+                }
+            } for param in param_names]
             
             # Add trailing slash if not present (Django convention)
             if not openapi_path.endswith('/') and openapi_path != '':
@@ -1343,17 +1915,24 @@ def generate_openapi_spec(project_path, output_file=None):
                 openapi_path = '/' + openapi_path
             
             # Find model associated with this path or view
-            model_name = infer_model_from_path_or_view(openapi_path, view, models_data, views_data)
+            model_name = infer_model(openapi_path, view)
             
             # Determine what HTTP methods this endpoint supports
             supported_methods = get_supported_methods_for_view(view, views_data)
             
+            # Bodies referencing the model schema, built once and shared by this path's operations
+            if model_name:
+                model_content = {"application/json": {"schema": {"$ref": _schema_ref(model_name)}}}
+                model_request_body = {"content": model_content, "required": True}
+                # Collection endpoints (GET /users/) return a list of the model
+                is_collection = not any(p["name"] in _DETAIL_PARAM_NAMES for p in path_params)
+            
             # Add operations for each supported method
             for method in supported_methods:
                 method_lower = method.lower()
                 
                 # Skip OPTIONS and HEAD for simplicity
-                if method_lower in ['options', 'head']:
+                if method_lower in _UNDOCUMENTED_METHODS:
                     continue
                 
                 operation = {
@@ -1368,48 +1947,27 @@ def generate_openapi_spec(project_path, output_file=None):
                 }
                 
                 # Add request body for POST, PUT, PATCH
-                if method_lower in ['post', 'put', 'patch'] and model_name:
-                    operation["requestBody"] = {
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "$ref": f"#/components/schemas/{model_name}"
-                                }
-                            }
-                        },
-                        "required": True
-                    }
+                if method_lower in _BODY_METHODS and model_name:
+                    operation["requestBody"] = model_request_body
                 
                 # Add response content for GET, POST, PUT, PATCH
-                if method_lower in ['get', 'post', 'put', 'patch'] and model_name:
+                if method_lower in _MODEL_RESPONSE_METHODS and model_name:
                     # For collection endpoints (GET /users/)
-                    if method_lower == 'get' and not any(p for p in path_params if p["name"] in ["pk", "id"]):
+                    if method_lower == 'get' and is_collection:
                         operation["responses"]["200"]["content"] = {
                             "application/json": {
                                 "schema": {
                                     "type": "array",
-                                    "items": {
-                                        "$ref": f"#/components/schemas/{model_name}"
-                                    }
+                                    "items": model_content["application/json"]["schema"]
                                 }
                             }
                         }
                     else:
                         # For single-item endpoints
-                        operation["responses"]["200"]["content"] = {
-                            "application/json": {
-                                "schema": {
-                                    "$ref": f"#/components/schemas/{model_name}"
-                                }
-                            }
-                        }
-                
-                # Initialize the path if it doesn't exist
-                if openapi_path not in openapi_spec["paths"]:
-                    openapi_spec["paths"][openapi_path] = {}
+                        operation["responses"]["200"]["content"] = model_content
                 
-                # Add the operation to the path
-                openapi_spec["paths"][openapi_path][method_lower] = operation
+                # Add the operation to the path, initializing the path if it doesn't exist
+                openapi_spec["paths"].setdefault(openapi_path, {})[method_lower] = operation
         
         # Generate synthetic endpoints for models that don't have explicit URL patterns
         synthetic_endpoints = generate_synthetic_endpoints(views_data, models_data, openapi_spec)
@@ -1420,17 +1978,12 @@ def generate_openapi_spec(project_path, output_file=None):
             method = endpoint['method']
             operation = endpoint['operation']
             
-            # Initialize the path if it doesn't exist
-            if path not in openapi_spec["paths"]:
-                openapi_spec["paths"][path] = {}
-            
-            # Add the operation to the path
-            openapi_spec["paths"][path][method] = operation
+            # Add the operation to the path, initializing the path if it doesn't exist
+            openapi_spec["paths"].setdefault(path, {})[method] = operation
         
         # Write the OpenAPI spec to a file if an output file is provided
         if output_file:
-            with open(output_file, 'w') as f:
-                json.dump(openapi_spec, f, indent=2)
+            write_spec(openapi_spec, output_file, pretty)
             print(f"OpenAPI specification written to {output_file}")
         
         return openapi_spec
@@ -1441,25 +1994,85 @@ def generate_openapi_spec(project_path, output_file=None):
         return None
 
 
-def infer_model_from_path_or_view(path, view_name, available_models, views_data=None):
-    """Infer model name from path or view name."""
+def _write_object(f, obj, dumps, pretty, depth=0, stream_key=None):
+    """
+    Write the dict obj as JSON one member at a time, and the members of obj[stream_key]
+    one at a time too, so no buffer ever holds more than a single path item. The bytes
+    match dumping obj in one call at the same nesting depth.
+    """
+    if not obj:
+        f.write(b'{}')
+        return
+    # Members sit one level deeper than the braces; JSON strings never hold raw newlines
+    pad = b'\n' + b'  ' * (depth + 1) if pretty else b''
+    key_sep = b': ' if pretty else b':'
+    f.write(b'{')
+    for index, (key, value) in enumerate(obj.items()):
+        if index:
+            f.write(b',')
+        f.write(pad)
+        f.write(dumps(key))
+        f.write(key_sep)
+        if key == stream_key and isinstance(value, dict):
+            _write_object(f, value, dumps, pretty, depth + 1)
+        else:
+            chunk = dumps(value)
+            f.write(chunk.replace(b'\n', pad) if pretty else chunk)
+    if pretty:
+        f.write(b'\n' + b'  ' * depth)
+    f.write(b'}')
+
+
+def write_spec(spec, output_file, pretty=False):
+    """Write spec to output_file as compact JSON (indented when pretty), streaming its paths."""
+    if orjson is None:
+        # json.dump already writes its iterencode chunks as they are produced
+        with open(output_file, 'w') as f:
+            if pretty:
+                json.dump(spec, f, indent=2)
+            else:
+                json.dump(spec, f, separators=(',', ':'))
+        return
+    option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+    dumps = functools.partial(orjson.dumps, option=option)
+    with open(output_file, 'wb') as f:
+        _write_object(f, spec, dumps, pretty, stream_key='paths')
+
+
+def _lowercase_names(available_models) -> Dict[str, str]:
+    """Map lowercased model names to models; the first of names differing only in case wins."""
+    lower_models = {}
+    for model in available_models:
+        lower_models.setdefault(model.lower(), model)
+    return lower_models
+
+
+def infer_model_from_path_or_view(path, view_name, available_models, views_data=None, lower_models=None):
+    """Infer model name from path or view name.
+    
+    Callers inferring many paths against the same models can build
+    _lowercase_names(available_models) once and pass it as lower_models.
+    """
+    if lower_models is None:
+        lower_models = _lowercase_names(available_models)
+    
     # Try to extract from path
     path_parts = path.strip('/').split('/')
     for part in path_parts:
         # Clean the part (remove api prefix, version numbers)
-        clean_part = re.sub(r'^v\d+', '', part)  # Remove version like v1
+        clean_part = _VERSION_RE.sub('', part)  # Remove version like v1
         clean_part = clean_part.rstrip('s')  # Remove trailing s for plurals
         
         # Check if this part is a model name
-        for model in available_models:
-            if clean_part.lower() == model.lower():
-                return model
+        model = lower_models.get(clean_part.lower())
+        if model:
+            return model
     
     # Try to extract from view name
     clean_view = view_name.replace('ViewSet', '').replace('View', '')
-    for model in available_models:
-        if clean_view.lower() == model.lower():
-            return model
+    model = lower_models.get(clean_view.lower())
+    if model:
+        return model
     
     # If views_data is provided, try to get the model from the viewset
     if views_data and view_name in views_data:
@@ -1475,11 +2088,16 @@ def parse_arguments():
     parser = argparse.ArgumentParser(description='Generate OpenAPI specification from Django application')
     parser.add_argument('-e', '--endpoint', required=True, help='Path to Django project root')
     parser.add_argument('-o', '--output', required=True, help='Output file path for OpenAPI specification')
+    parser.add_argument('-v', '--verbose', action='store_true', help='Report every discovered URL pattern')
+    parser.add_argument('--pretty', action='store_true', help='Indent the JSON output (default: compact)')
+    parser.add_argument('--no-cache', action='store_true', help='Ignore and do not update the on-disk extraction cache')
     return parser.parse_args()
 
 
 def main():
     args = parse_arguments()
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO,
+                        format='%(message)s', stream=sys.stdout)
     
     # Validate input directory exists
     if not os.path.isdir(args.endpoint):
@@ -1493,11 +2111,15 @@ def main():
     
     print(f"Analyzing Django project at {args.endpoint}")
     
+    if not args.no_cache:
+        load_extract_cache(args.endpoint)
+    
     # Regular flow for all Django projects - rely on static analysis instead of hardcoding
     project_data = analyze_django_project(args.endpoint)
     
     print(f"Generating OpenAPI specification")
-    spec = generate_openapi_spec(args.endpoint, args.output)
+    spec = generate_openapi_spec(args.endpoint, args.output, project_data, args.pretty)
+    store_extract_cache(args.endpoint)
     
     if spec is not None:
         print(f"✅ Successfully generated OpenAPI specification at {args.output}")
@@ -1508,15 +2130,40 @@ def main():
         sys.exit(1)
 
 
+# Model-independent parts of the synthetic CRUD operations. Operations are never
+# modified once built, so every model's operations share these objects
+_BEARER_SECURITY = [{"BearerAuth": []}]
+_ID_PATH_PARAMETERS = [{"$ref": "#/components/parameters/IdPath"}]
+_BAD_REQUEST_RESPONSE = {"$ref": "#/components/responses/BadRequest"}
+_UNAUTHORIZED_RESPONSE = {"$ref": "#/components/responses/Unauthorized"}
+_NOT_FOUND_RESPONSE = {"$ref": "#/components/responses/NotFound"}
+_LIST_ERROR_RESPONSES = {"401": _UNAUTHORIZED_RESPONSE}
+_CREATE_ERROR_RESPONSES = {"400": _BAD_REQUEST_RESPONSE, "401": _UNAUTHORIZED_RESPONSE}
+_DETAIL_ERROR_RESPONSES = {"404": _NOT_FOUND_RESPONSE, "401": _UNAUTHORIZED_RESPONSE}
+_UPDATE_ERROR_RESPONSES = {"400": _BAD_REQUEST_RESPONSE, "404": _NOT_FOUND_RESPONSE, "401": _UNAUTHORIZED_RESPONSE}
+_DELETE_RESPONSES = {
+    "204": {"$ref": "#/components/responses/NoContent"},
+    "404": _NOT_FOUND_RESPONSE,
+    "401": _UNAUTHORIZED_RESPONSE
+}
+
+
 def generate_synthetic_endpoints(views_data, models_data, openapi_spec):
     """Generate synthetic endpoints for viewsets that might not be captured in URL patterns."""
     synthetic_endpoints = []
     
+    # Sorted, the paths that start with a prefix are contiguous, beginning at its bisect point
+    existing_paths = sorted(openapi_spec['paths'])
+    
     # Look for ViewSets in views data
     for view_name, view_info in views_data.items():
-        # Check if this is a ViewSet
-        if not view_name.endswith('ViewSet') and not any(base.endswith('ViewSet') for base in view_info.get('base_classes', [])):
-            continue
+        # Check if this is a ViewSet, by name or else by a ViewSet base class
+        if not view_name.endswith('ViewSet'):
+            for base in view_info.get('base_classes', ()):
+                if base.endswith('ViewSet'):
+                    break
+            else:
+                continue
         
         # Try to determine the model this viewset works with
         model_name = None
@@ -1542,22 +2189,21 @@ def generate_synthetic_endpoints(views_data, models_data, openapi_spec):
         endpoint = model_name_to_endpoint(model_name)
         base_path = f"/api/{endpoint}"
         
-        # Check if this path already exists in the OpenAPI spec
-        path_exists = False
-        for path in openapi_spec['paths'].keys():
-            if path.startswith(base_path):
-                path_exists = True
-                break
-        
-        # Skip if paths for this model already exist
-        if path_exists:
+        # Skip if paths for this model already exist in the OpenAPI spec
+        index = bisect.bisect_left(existing_paths, base_path)
+        if index < len(existing_paths) and existing_paths[index].startswith(base_path):
             continue
             
+        # One schema $ref body per model, shared by every operation that sends or returns it
+        model_content = {"application/json": {"schema": {"$ref": _schema_ref(model_name)}}}
+        model_request_body = {"content": model_content, "required": True}
+        model_lower = model_name.lower()
+        
         # Add list endpoint (GET /api/users/)
         list_path = f"{base_path}/"
         list_operation = {
             "summary": f"List {model_name} objects",
-            "operationId": f"list_{model_name.lower()}s",
+            "operationId": f"list_{model_lower}s",
             "responses": {
                 "200": {
                     "description": "Successful operation",
@@ -1565,18 +2211,14 @@ def generate_synthetic_endpoints(views_data, models_data, openapi_spec):
                         "application/json": {
                             "schema": {
                                 "type": "array",
-                                "items": {
-                                    "$ref": f"#/components/schemas/{model_name}"
-                                }
+                                "items": model_content["application/json"]["schema"]
                             }
                         }
                     }
                 },
-                "401": {
-                    "description": "Unauthorized"
-                }
+                **_LIST_ERROR_RESPONSES
             },
-            "security": [{"BearerAuth": []}]
+            "security": _BEARER_SECURITY
         }
         synthetic_endpoints.append({
             'path': list_path,
@@ -1587,36 +2229,13 @@ def generate_synthetic_endpoints(views_data, models_data, openapi_spec):
         # Add create endpoint (POST /api/users/)
         create_operation = {
             "summary": f"Create {model_name} object",
-            "operationId": f"create_{model_name.lower()}",
-            "requestBody": {
-                "content": {
-                    "application/json": {
-                        "schema": {
-                            "$ref": f"#/components/schemas/{model_name}"
-                        }
-                    }
-                },
-                "required": True
-            },
+            "operationId": f"create_{model_lower}",
+            "requestBody": model_request_body,
             "responses": {
-                "201": {
-                    "description": "Created",
-                    "content": {
-                        "application/json": {
-                            "schema": {
-                                "$ref": f"#/components/schemas/{model_name}"
-                            }
-                        }
-                    }
-                },
-                "400": {
-                    "description": "Bad request"
-                },
-                "401": {
-                    "description": "Unauthorized"
-                }
+                "201": {"description": "Created", "content": model_content},
+                **_CREATE_ERROR_RESPONSES
             },
-            "security": [{"BearerAuth": []}]
+            "security": _BEARER_SECURITY
         }
         synthetic_endpoints.append({
             'path': list_path,
@@ -1628,37 +2247,13 @@ def generate_synthetic_endpoints(views_data, models_data, openapi_spec):
         detail_path = f"{base_path}/{{id}}/"
         detail_operation = {
             "summary": f"Get {model_name} object",
-            "operationId": f"get_{model_name.lower()}",
-            "parameters": [
-                {
-                    "name": "id",
-                    "in": "path",
-                    "required": True,
-                    "schema": {
-                        "type": "integer",
-                        "format": "int64"
-                    }
-                }
-            ],
+            "operationId": f"get_{model_lower}",
+            "parameters": _ID_PATH_PARAMETERS,
             "responses": {
-                "200": {
-                    "description": "Successful operation",
-                    "content": {
-                        "application/json": {
-                            "schema": {
-                                "$ref": f"#/components/schemas/{model_name}"
-                            }
-                        }
-                    }
-                },
-                "404": {
-                    "description": "Not found"
-                },
-                "401": {
-                    "description": "Unauthorized"
-                }
+                "200": {"description": "Successful operation", "content": model_content},
+                **_DETAIL_ERROR_RESPONSES
             },
-            "security": [{"BearerAuth": []}]
+            "security": _BEARER_SECURITY
         }
         synthetic_endpoints.append({
             'path': detail_path,
@@ -1669,50 +2264,14 @@ def generate_synthetic_endpoints(views_data, models_data, openapi_spec):
         # Add update endpoint (PUT /api/users/{id}/)
         update_operation = {
             "summary": f"Update {model_name} object",
-            "operationId": f"update_{model_name.lower()}",
-            "parameters": [
-                {
-                    "name": "id",
-                    "in": "path",
-                    "required": True,
-                    "schema": {
-                        "type": "integer",
-                        "format": "int64"
-                    }
-                }
-            ],
-            "requestBody": {
-                "content": {
-                    "application/json": {
-                        "schema": {
-                            "$ref": f"#/components/schemas/{model_name}"
-                        }
-                    }
-                },
-                "required": True
-            },
+            "operationId": f"update_{model_lower}",
+            "parameters": _ID_PATH_PARAMETERS,
+            "requestBody": model_request_body,
             "responses": {
-                "200": {
-                    "description": "Successful operation",
-                    "content": {
-                        "application/json": {
-                            "schema": {
-                                "$ref": f"#/components/schemas/{model_name}"
-                            }
-                        }
-                    }
-                },
-                "400": {
-                    "description": "Bad request"
-                },
-                "404": {
-                    "description": "Not found"
-                },
-                "401": {
-                    "description": "Unauthorized"
-                }
+                "200": {"description": "Successful operation", "content": model_content},
+                **_UPDATE_ERROR_RESPONSES
             },
-            "security": [{"BearerAuth": []}]
+            "security": _BEARER_SECURITY
         }
         synthetic_endpoints.append({
             'path': detail_path,
@@ -1723,30 +2282,10 @@ def generate_synthetic_endpoints(views_data, models_data, openapi_spec):
         # Add delete endpoint (DELETE /api/users/{id}/)
         delete_operation = {
             "summary": f"Delete {model_name} object",
-            "operationId": f"delete_{model_name.lower()}",
-            "parameters": [
-                {
-                    "name": "id",
-                    "in": "path",
-                    "required": True,
-                    "schema": {
-                        "type": "integer",
-                        "format": "int64"
-                    }
-                }
-            ],
-            "responses": {
-                "204": {
-                    "description": "No content"
-                },
-                "404": {
-                    "description": "Not found"
-                },
-                "401": {
-                    "description": "Unauthorized"
-                }
-            },
-            "security": [{"BearerAuth": []}]
+            "operationId": f"delete_{model_lower}",
+            "parameters": _ID_PATH_PARAMETERS,
+            "responses": _DELETE_RESPONSES,
+            "security": _BEARER_SECURITY
         }
         synthetic_endpoints.append({
             'path': detail_path,
@@ -1771,69 +2310,43 @@ def find_urls_file(project_root: str) -> Optional[str]:
             return location
     
     # Look for any urls.py file
-    for root, _, files in os.walk(project_root):
-        if 'urls.py' in files:
-            return os.path.join(root, 'urls.py')
-    
-    return None
+    return next(_find_urls_py(project_root), None)
+
+
+# Django field types, plus OpenAPI types passed through unchanged
+_OPENAPI_TYPE_MAP: Dict[str, str] = {
+    **_DJANGO_TO_OPENAPI,
+    'string': 'string',
+    'integer': 'integer',
+    'boolean': 'boolean',
+    'number': 'number',
+    'object': 'object',
+    'array': 'array'
+}
 
 
 def convert_django_type_to_openapi(django_type):
     """Convert Django field type to OpenAPI type."""
-    # Map of Django field types to OpenAPI types
-    type_map = {
-        'CharField': 'string',
-        'TextField': 'string',
-        'EmailField': 'string',
-        'URLField': 'string',
-        'SlugField': 'string',
-        'UUIDField': 'string',
-        'FileField': 'string',
-        'ImageField': 'string',
-        'BooleanField': 'boolean',
-        'NullBooleanField': 'boolean',
-        'IntegerField': 'integer',
-        'PositiveIntegerField': 'integer',
-        'PositiveSmallIntegerField': 'integer',
-        'SmallIntegerField': 'integer',
-        'BigIntegerField': 'integer',
-        'FloatField': 'number',
-        'DecimalField': 'number',
-        'DateField': 'string',
-        'TimeField': 'string',
-        'DateTimeField': 'string',
-        'DurationField': 'string',
-        'JSONField': 'object',
-        'ForeignKey': 'integer',
-        'OneToOneField': 'integer',
-        'ManyToManyField': 'array',
-        'string': 'string',
-        'integer': 'integer',
-        'boolean': 'boolean',
-        'number': 'number',
-        'object': 'object',
-        'array': 'array'
-    }
-    
-    return type_map.get(django_type, 'string')
+    return _OPENAPI_TYPE_MAP.get(django_type, 'string')
+
+
+# Django field types -> OpenAPI formats
+_OPENAPI_FORMATS: Dict[str, str] = {
+    'DateField': 'date',
+    'DateTimeField': 'date-time',
+    'EmailField': 'email',
+    'URLField': 'uri',
+    'UUIDField': 'uuid',
+    'IPAddressField': 'ipv4',
+    'GenericIPAddressField': 'ipv4',
+    'TimeField': 'time',
+    'DecimalField': 'decimal'
+}
 
 
 def get_openapi_format_for_field(field_type):
     """Get OpenAPI format for field type."""
-    # Map of Django field types to OpenAPI formats
-    format_map = {
-        'DateField': 'date',
-        'DateTimeField': 'date-time',
-        'EmailField': 'email',
-        'URLField': 'uri',
-        'UUIDField': 'uuid',
-        'IPAddressField': 'ipv4',
-        'GenericIPAddressField': 'ipv4',
-        'TimeField': 'time',
-        'DecimalField': 'decimal'
-    }
-    
-    return format_map.get(field_type)
+    return _OPENAPI_FORMATS.get(field_type)
 
 
 def get_supported_methods_for_view(view_name, views_data):
@@ -1870,7 +2383,7 @@ def generate_operation_id(method, path, view_name):
         
     # Clean up the view name
     # Extract the class name if view is like ViewClass.as_view()
-    view_match = re.search(r'(\w+)(?:\.as_view\(\)|$|\W)', view_name)
+    view_match = _VIEW_NAME_RE.search(view_name)
     if view_match:
         view_class = view_match.group(1)
     else:
@@ -1884,11 +2397,11 @@ def generate_operation_id(method, path, view_name):
     
     # Use snake_case for the view class name if it's in camelCase
     # Convert UserProfile to user_profile
-    view_class = re.sub(r'([a-z0-9])([A-Z])', r'\1_\2', view_class).lower()
+    view_class = _CAMEL_BOUNDARY_RE.sub(r'\1_\2', view_class).lower()
     
     # Clean up the path
     # Remove any path parameters
-    clean_path = re.sub(r'\{[^}]+\}', '', path)
+    clean_path = _BRACED_PARAM_RE.sub('', path)
     
     # Convert to snake_case path segments
     # e.g., /api/userProfile/items/ becomes api_user_profile_items
@@ -1902,13 +2415,13 @@ def generate_operation_id(method, path, view_name):
             continue
             
         # Convert camelCase to snake_case 
-        part = re.sub(r'([a-z0-9])([A-Z])', r'\1_\2', part).lower()
+        part = _CAMEL_BOUNDARY_RE.sub(r'\1_\2', part).lower()
         
         # Replace special characters with underscores
-        part = re.sub(r'[^a-z0-9_]', '_', part)
+        part = _NON_IDENT_RE.sub('_', part)
         
         # Remove duplicate underscores
-        part = re.sub(r'_+', '_', part)
+        part = _UNDERSCORE_RUN_RE.sub('_', part)
         
         # Remove leading and trailing underscores
         part = part.strip('_')
@@ -13,28 +13,111 @@ import re
 import json
 import ast
 import argparse
-from apispec import APISpec
-from apispec.ext.marshmallow import MarshmallowPlugin
+import functools
+import hashlib
+import pickle
 
-class FlaskRouteVisitor(ast.NodeVisitor):
+try:
+    import orjson
+except ImportError:  # optional speed-up; stdlib json is the fallback
+    orjson = None
+
+# Flask route parameter syntax: <name> or <converter:name>
+_PARAM_RE = re.compile(r'<(?:(?:int|float|string|path|uuid):)?([^>]+)>')
+
+# Method shortcut decorators: @app.get(...), @app.post(...), ...
+_HTTP_METHOD_DECORATORS = frozenset({'get', 'post', 'put', 'delete', 'patch'})
+
+# Every operation documents the same response; apispec only reads it
+_DEFAULT_RESPONSES = {
+    "200": {
+        "description": "Successful response"
+    }
+}
+
+# Flask path parameters are all documented as required strings
+_STRING_SCHEMA = {"type": "string"}
+_PATH_PARAM_TEMPLATE = {"in": "path", "required": True, "schema": _STRING_SCHEMA}
+
+# name -> parameter object; recurring names (id, user_id, ...) share one dict
+_path_param_cache = {}
+
+def _build_path_params(param_names):
+    """Build the OpenAPI path-parameter objects for *param_names*.
+
+    Every parameter differs only by name, so each name is built once from a
+    template and then shared by reference; apispec never mutates them.
+    """
+    params = []
+    for name in param_names:
+        param = _path_param_cache.get(name)
+        if param is None:
+            param = _path_param_cache[name] = {"name": name, **_PATH_PARAM_TEMPLATE}
+        params.append(param)
+    return params
+
+@functools.lru_cache(maxsize=2048)
+def _convert_path(path):
+    """Split a Flask route once into its OpenAPI path and parameter names.
+
+    ``_PARAM_RE.split`` yields literal segments at even indexes and captured
+    parameter names at odd ones, so both results come from a single C scan.
+    Memoized because the same rule string is often decorated more than once
+    (one view per method); the names are a tuple since results are shared.
+    """
+    parts = _PARAM_RE.split(path)
+    names = tuple(parts[1::2])
+    parts[1::2] = [f"{{{name}}}" for name in names]
+    return "".join(parts), names
+
+# Nodes without AST children worth visiting (a Name's only child is its Load/Store context)
+_LEAF_NODES = frozenset({ast.Name, ast.Constant, ast.alias, ast.Load, ast.Store, ast.Del})
+
+def _is_flask_ctor(func):
+    """True for the ``Flask`` / ``flask.Flask`` callee of an app instantiation."""
+    func_type = type(func)
+    if func_type is ast.Name:
+        return func.id == 'Flask'
+    return func_type is ast.Attribute and func.attr == 'Flask'
+
+class FlaskRouteVisitor:
     """AST visitor to extract Flask routes without executing the code."""
     def __init__(self):
         self.routes = []
+        self.operation_count = 0
         self.app_name = None
         self.current_app_var = None
         self.possible_app_vars = set()
+
+    def visit(self, tree):
+        # Iterative pre-order walk in source order; only Assign/Call nodes
+        # have handlers, everything else costs a single dict miss. Leaves,
+        # most of the tree, are dropped before listing their (no) children
+        get_handler = self._DISPATCH.get
+        iter_child_nodes = ast.iter_child_nodes
+        stack = [tree]
+        pop, extend = stack.pop, stack.extend
+        while stack:
+            node = pop()
+            node_type = type(node)
+            if node_type in _LEAF_NODES:
+                continue
+            handler = get_handler(node_type)
+            if handler is not None:
+                handler(self, node)
+            children = list(iter_child_nodes(node))
+            children.reverse()
+            extend(children)
         
     def visit_Assign(self, node):
-        # Detect Flask app instantiation: app = Flask(__name__)
-        if isinstance(node.value, ast.Call) and isinstance(node.value.func, ast.Name) and node.value.func.id == 'Flask':
+        # Detect Flask app instantiation: app = Flask(__name__) / flask.Flask(__name__)
+        if type(node.value) is ast.Call and _is_flask_ctor(node.value.func):
             for target in node.targets:
                 if isinstance(target, ast.Name):
                     self.possible_app_vars.add(target.id)
                     # Use the first Flask instance as the app name if not already set
                     if not self.app_name:
                         self.app_name = target.id
-        # Continue visiting
-        self.generic_visit(node)
         
     def visit_Call(self, node):
         # Find route decorators: @app.route('/path', methods=['GET'])
@@ -43,12 +126,12 @@ class FlaskRouteVisitor(ast.NodeVisitor):
                 self.current_app_var = node.func.value.id
                 self._process_route_decorator(node)
         # Also check for @app.get('/path'), @app.post('/path') etc.
-        elif isinstance(node.func, ast.Attribute) and node.func.attr in ['get', 'post', 'put', 'delete', 'patch']:
+        elif isinstance(node.func, ast.Attribute) and node.func.attr in _HTTP_METHOD_DECORATORS:
             if isinstance(node.func.value, ast.Name) and node.func.value.id in self.possible_app_vars:
                 self.current_app_var = node.func.value.id
                 self._process_http_method_decorator(node)
-        # Continue visiting
-        self.generic_visit(node)
+
+    _DISPATCH = {ast.Assign: visit_Assign, ast.Call: visit_Call}
     
     def _process_route_decorator(self, node):
         path = None
@@ -71,7 +154,7 @@ class FlaskRouteVisitor(ast.NodeVisitor):
     
     def _process_http_method_decorator(self, node):
         path = None
-        method = node.func.attr.lower()  # get, post, etc.
+        method = node.func.attr  # get, post, etc. (already lower-case, see visit_Call)
         endpoint = None
         
         # Extract path from first argument
@@ -87,142 +170,212 @@ class FlaskRouteVisitor(ast.NodeVisitor):
             self._add_route(path, [method], endpoint)
     
     def _extract_string_value(self, node):
-        if isinstance(node, ast.Str):
-            return node.s
+        # String literals are ast.Constant; ast.Str is a deprecated shim over it
+        if type(node) is ast.Constant and type(node.value) is str:
+            return node.value
         return None
     
     def _extract_list_of_strings(self, node):
         if isinstance(node, ast.List):
-            methods = []
-            for elt in node.elts:
-                if isinstance(elt, ast.Str):
-                    methods.append(elt.s.lower())
-            return methods
+            return [elt.value.lower() for elt in node.elts
+                    if type(elt) is ast.Constant and type(elt.value) is str]
         return ['get']  # Default to GET if not a list
     
     def _add_route(self, path, methods, endpoint=None):
         # Generate an endpoint name if not specified
         if not endpoint:
-            endpoint = f"endpoint_{len(self.routes)}"
+            endpoint = f"endpoint_{self.operation_count}"
         
-        # Extract path parameters
-        path_params = []
-        path_param_matches = re.finditer(r'<(?:(?:int|float|string|path|uuid):)?([^>]+)>', path)
-        for match in path_param_matches:
-            param_name = match.group(1)
-            path_params.append({
-                "name": param_name,
-                "in": "path",
-                "required": True,
-                "schema": {"type": "string"}
-            })
+        # Convert Flask-style route to OpenAPI path format and extract path parameters
+        openapi_path, param_names = _convert_path(path)
+        path_params = _build_path_params(param_names)
         
-        # Convert Flask-style route to OpenAPI path format
-        openapi_path = re.sub(r'<(?:int|float|string|path|uuid):([^>]+)>', r'{\1}', path)
-        openapi_path = re.sub(r'<([^>]+)>', r'{\1}', openapi_path)
-        
-        # Add route for each method
-        for method in methods:
-            self.routes.append({
-                "path": openapi_path,
-                "method": method,
-                "operation_id": endpoint,
-                "description": f"Endpoint for {method.upper()} {path}",
-                "parameters": path_params,
-            })
+        # One record per decorator; operations are expanded per method later
+        self.routes.append({
+            "path": openapi_path,
+            "raw_path": path,
+            "methods": methods,
+            "operation_id": endpoint,
+            "parameters": path_params,
+        })
+        self.operation_count += len(methods)
 
 def extract_routes_from_file(file_path):
     """Extract Flask routes from a Python file without executing it."""
     try:
-        with open(file_path, 'r') as f:
+        with open(file_path, 'rb') as f:
             source_code = f.read()
-        
-        tree = ast.parse(source_code)
-        visitor = FlaskRouteVisitor()
-        visitor.visit(tree)
-        
-        app_name = visitor.app_name or "FlaskApp"
-        return app_name, visitor.routes
+    except OSError as e:
+        print(f"Error reading Flask app '{file_path}': {e}")
+        sys.exit(1)
     
-    except Exception as e:
-        print(f"Error analyzing Flask app: {e}")
+    try:
+        tree = ast.parse(source_code, filename=file_path)
+    except (SyntaxError, ValueError) as e:
+        print(f"Error parsing Flask app '{file_path}': {e}")
         sys.exit(1)
+    
+    visitor = FlaskRouteVisitor()
+    visitor.visit(tree)
+    
+    app_name = visitor.app_name or "FlaskApp"
+    return app_name, visitor.routes
 
 def generate_openapi_spec(app_name, routes):
     """Generate OpenAPI specification from analyzed routes."""
+    # Imported here so --help and cache hits never pay for apispec/marshmallow
+    from apispec import APISpec
+    from apispec.ext.marshmallow import MarshmallowPlugin
+    
     # Create an APISpec
     spec = APISpec(
         title=app_name,
         version="1.0.0",
         openapi_version="3.0.2",
         plugins=[MarshmallowPlugin()],
+        # Base path /proxy/flask, emitted by to_dict() via the spec options
+        servers=[
+            {
+                "url": "/proxy/flask",
+                "description": "API with base path"
+            }
+        ],
     )
     
-    # Add paths to the spec
+    # Group operations by path so each path is registered once
+    operations_by_path = {}
+    operations_for = operations_by_path.setdefault
     for route in routes:
-        operation = {
+        # Everything but the description is shared by the route's methods
+        base_operation = {
             "operationId": route["operation_id"],
-            "description": route["description"],
-            "responses": {
-                "200": {
-                    "description": "Successful response"
-                }
-            }
+            "responses": _DEFAULT_RESPONSES,
         }
         
-        if route["parameters"]:
-            operation["parameters"] = route["parameters"]
+        parameters = route["parameters"]
+        if parameters:
+            base_operation["parameters"] = parameters
         
-        # Add the path to the spec
-        spec.path(
-            path=route["path"],
-            operations={route["method"]: operation}
-        )
+        raw_path = route["raw_path"]
+        operations = operations_for(route["path"], {})
+        for method in route["methods"]:
+            operations[method] = {
+                **base_operation,
+                "description": f"Endpoint for {method.upper()} {raw_path}",
+            }
     
-    # Get the finished spec
-    spec_dict = spec.to_dict()
+    # Add the paths to the spec
+    add_path = spec.path
+    for path, operations in operations_by_path.items():
+        add_path(path=path, operations=operations)
     
-    # Add base path as /proxy
-    spec_dict["servers"] = [
-        {
-            "url": "/proxy/flask",
-            "description": "API with base path"
-        }
-    ]
-    
-    return spec_dict
+    # Get the finished spec
+    return spec.to_dict()
+
+# Generated specs are cached per (input path, mtime, size, creator version)
+_SPEC_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache")),
+    "spec_creator", "flask",
+)
+
+def _spec_cache_file(file_path):
+    abs_path = os.path.abspath(file_path)
+    st = os.stat(abs_path)
+    key = repr((abs_path, st.st_mtime_ns, st.st_size, os.path.getmtime(__file__)))
+    return os.path.join(_SPEC_CACHE_DIR, hashlib.sha256(key.encode()).hexdigest() + ".pkl")
+
+def load_cached_spec(file_path):
+    """Return the cached (spec, route_count) for an unchanged input file, or None."""
+    try:
+        with open(_spec_cache_file(file_path), "rb") as f:
+            return pickle.load(f)
+    except Exception:
+        return None
+
+def store_cached_spec(file_path, spec, route_count):
+    """Best-effort write of the generated spec to the cache."""
+    try:
+        cache_file = _spec_cache_file(file_path)
+        os.makedirs(_SPEC_CACHE_DIR, exist_ok=True)
+        tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+        with open(tmp_file, "wb") as f:
+            pickle.dump((spec, route_count), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass
+
+def write_spec(spec, output_path, pretty=False):
+    """Write *spec* as JSON, one top-level member at a time.
+
+    With orjson only the bytes of the member being written are alive at once
+    (the ``paths`` object dominates), instead of a single buffer holding the
+    whole document. Output is identical to dumping the dict in one call.
+    """
+    if orjson is None:
+        with open(output_path, "w") as f:
+            if pretty:
+                json.dump(spec, f, indent=2, sort_keys=True)
+            else:
+                json.dump(spec, f, separators=(",", ":"), sort_keys=True)
+        return
+
+    option = orjson.OPT_SORT_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+    separator, key_sep, opening, closing = (
+        (b",\n  ", b": ", b"{\n  ", b"\n}") if pretty else (b",", b":", b"{", b"}")
+    )
+    with open(output_path, "wb") as f:
+        f.write(opening)
+        for index, key in enumerate(sorted(spec)):
+            if index:
+                f.write(separator)
+            value = orjson.dumps(spec[key], option=option)
+            if pretty:
+                # Nest the member one level deeper; JSON strings never hold raw newlines
+                value = value.replace(b"\n", b"\n  ")
+            f.write(orjson.dumps(key))
+            f.write(key_sep)
+            f.write(value)
+        f.write(closing)
 
 def parse_arguments():
     parser = argparse.ArgumentParser(description='Generate OpenAPI specification from Flask application')
     parser.add_argument('-e', '--endpoint', required=True, help='Path to Flask application file')
     parser.add_argument('-o', '--output', required=True, help='Output file path for OpenAPI specification')
+    parser.add_argument('--pretty', action='store_true', help='Indent the JSON output (default: compact)')
+    parser.add_argument('--no-cache', action='store_true', help='Ignore and do not update the on-disk spec cache')
     return parser.parse_args()
 
 def main():
     args = parse_arguments()
     
     # Validate input file exists
-    if not os.path.exists(args.endpoint):
+    if not os.path.isfile(args.endpoint):
         print(f"Error: Input file '{args.endpoint}' not found")
         sys.exit(1)
     
     # Create output directory if it doesn't exist
     output_dir = os.path.dirname(args.output)
-    if output_dir and not os.path.exists(output_dir):
-        os.makedirs(output_dir)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
     
-    # Extract routes using static analysis
-    app_name, routes = extract_routes_from_file(args.endpoint)
-    
-    # Generate the OpenAPI spec
-    spec = generate_openapi_spec(app_name, routes)
+    cached = None if args.no_cache else load_cached_spec(args.endpoint)
+    if cached is not None:
+        spec, route_count = cached
+    else:
+        # Extract routes using static analysis
+        app_name, routes = extract_routes_from_file(args.endpoint)
+        route_count = sum(len(route['methods']) for route in routes)
+        
+        # Generate the OpenAPI spec
+        spec = generate_openapi_spec(app_name, routes)
+        if not args.no_cache:
+            store_cached_spec(args.endpoint, spec, route_count)
     
-    # Write to output file
-    with open(args.output, "w") as f:
-        json.dump(spec, f, indent=2)
+    # Write to output file (compact unless --pretty)
+    write_spec(spec, args.output, args.pretty)
     
     print(f"✅ Successfully generated OpenAPI specification at {args.output}")
-    print(f"Found {len(routes)} routes in the Flask application")
+    print(f"Found {route_count} routes in the Flask application")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
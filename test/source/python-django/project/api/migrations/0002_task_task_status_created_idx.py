@@ -0,0 +1,19 @@
+# Generated by Django 4.2.10 on 2026-10-14 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                fields=["status", "-created_at"], name="task_status_created_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.10 on 2026-10-14 09:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0002_task_task_status_created_idx"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(fields=["updated_at"], name="task_updated_idx"),
+        ),
+    ]
@@ -27,6 +27,12 @@ class Task(models.Model):
         
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # Serves by_status: the status filter plus the default ordering
+            models.Index(fields=['status', '-created_at'], name='task_status_created_idx'),
+            # Serves the list ETag's MAX(updated_at) without scanning the table
+            models.Index(fields=['updated_at'], name='task_updated_idx'),
+        ]
 
 
 class Category(models.Model):
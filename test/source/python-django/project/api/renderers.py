@@ -0,0 +1,24 @@
+import orjson
+from rest_framework.renderers import JSONRenderer
+
+
+class OrjsonRenderer(JSONRenderer):
+    """JSONRenderer that encodes with orjson.
+    
+    Types orjson does not handle natively (lazy translations, Decimal, ...)
+    fall back to DRF's own JSONEncoder. U+2028 and U+2029 are escaped as
+    JSONRenderer does. Unlike JSONRenderer under STRICT_JSON, NaN and
+    Infinity are not rejected: orjson encodes them as null.
+    """
+    options = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+    
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        options = self.options
+        # orjson only indents by two spaces; any requested indent (e.g. the browsable API's) gets that
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            options |= orjson.OPT_INDENT_2
+        ret = orjson.dumps(data, default=self.encoder_class().default, option=options)
+        # Escaped so the output stays a strict JavaScript subset, as JSONRenderer does
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
@@ -1,8 +1,26 @@
+import copy
+
 from rest_framework import serializers
 from .models import Task, Category
 
 
-class TaskSerializer(serializers.ModelSerializer):
+class CachedFieldsModelSerializer(serializers.ModelSerializer):
+    """ModelSerializer that introspects its model once per serializer class.
+    
+    The fields depend only on the model and Meta, so the unbound fields built by
+    the first instance are kept and later instances get copies of them.
+    """
+    _fields_templates = {}
+    
+    def get_fields(self):
+        cls = type(self)
+        template = self._fields_templates.get(cls)
+        if template is None:
+            template = self._fields_templates[cls] = super().get_fields()
+        return copy.deepcopy(template)
+
+
+class TaskSerializer(CachedFieldsModelSerializer):
     """Serializer for Task model"""
     
     class Meta:
@@ -12,7 +30,46 @@ class TaskSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at', 'updated_at']
 
 
-class CategorySerializer(serializers.ModelSerializer):
+class TaskReadSerializer(TaskSerializer):
+    """Output-only Task serializer; read-only fields build no validators"""
+    
+    class Meta(TaskSerializer.Meta):
+        read_only_fields = TaskSerializer.Meta.fields
+
+
+class StaticTaskSerializer:
+    """Attribute-access Task serializer for large read-only lists.
+    
+    Renders the same dicts as TaskReadSerializer, serpy-style: no fields are built
+    or bound per request, and dates are formatted by DRF's own field classes.
+    """
+    _date_field = serializers.DateField()
+    _datetime_field = serializers.DateTimeField()
+    
+    def __init__(self, instance, many=False):
+        self.instance = instance
+        self.many = many
+    
+    def to_representation(self, task):
+        datetime_to_representation = self._datetime_field.to_representation
+        return {
+            'id': task.id,
+            'title': task.title,
+            'description': task.description,
+            'status': task.status,
+            'due_date': self._date_field.to_representation(task.due_date),
+            'created_at': datetime_to_representation(task.created_at),
+            'updated_at': datetime_to_representation(task.updated_at),
+        }
+    
+    @property
+    def data(self):
+        if self.many:
+            return [self.to_representation(task) for task in self.instance]
+        return self.to_representation(self.instance)
+
+
+class CategorySerializer(CachedFieldsModelSerializer):
     """Serializer for Category model"""
     
     class Meta:
@@ -21,11 +78,11 @@ class CategorySerializer(serializers.ModelSerializer):
         read_only_fields = ['id']
 
 
-class CategoryDetailSerializer(serializers.ModelSerializer):
+class CategoryDetailSerializer(CachedFieldsModelSerializer):
     """Serializer for Category model with related tasks"""
     tasks = TaskSerializer(many=True, read_only=True)
     
     class Meta:
         model = Category
         fields = ['id', 'name', 'description', 'tasks']
-        read_only_fields = ['id'] 
\ No newline at end of file
+        read_only_fields = fields 
\ No newline at end of file
@@ -0,0 +1,16 @@
+from django.core.cache import cache
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .models import Task
+
+# Cached TaskViewSet.by_status results, one key per valid status. Only these
+# statuses are cached, so invalidation knows every key that can exist
+BY_STATUS_CACHE_KEYS = {value: f"tasks:by_status:{value}" for value, _ in Task.STATUS_CHOICES}
+BY_STATUS_CACHE_TIMEOUT = 60
+
+
+@receiver([post_save, post_delete], sender=Task)
+def invalidate_by_status_cache(sender, **kwargs):
+    """Drop every cached by_status list; a save can move a task between statuses."""
+    cache.delete_many(list(BY_STATUS_CACHE_KEYS.values()))
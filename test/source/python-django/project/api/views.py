@@ -1,3 +1,9 @@
+import hashlib
+
+from django.core.cache import cache
+from django.db.models import Count, Max, Prefetch
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
@@ -5,7 +11,47 @@ from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 
 from .models import Task, Category
-from .serializers import TaskSerializer, CategorySerializer, CategoryDetailSerializer
+from .serializers import (
+    TaskSerializer, TaskReadSerializer, StaticTaskSerializer,
+    CategorySerializer, CategoryDetailSerializer,
+)
+from .signals import BY_STATUS_CACHE_KEYS, BY_STATUS_CACHE_TIMEOUT
+
+# Statuses by_status accepts; anything else is rejected before touching the database
+VALID_STATUSES = frozenset(value for value, _ in Task.STATUS_CHOICES)
+
+def task_list_etag(request, *args, **kwargs):
+    """ETag for the task list: any save moves the newest updated_at, any delete the count.
+    
+    This costs one aggregate query on every list GET, including those that
+    go on to a 200 and the paginator's own COUNT. MAX(updated_at) is read
+    from task_updated_idx; COUNT(id) still scans an index of the table.
+    
+    The negotiated media type is included because the JSON and browsable API
+    representations share a URL.
+    """
+    version = Task.objects.aggregate(count=Count('id'), latest=Max('updated_at'))
+    key = f"{version['count']}:{version['latest']}:{request.accepted_media_type}"
+    return hashlib.md5(key.encode(), usedforsecurity=False).hexdigest()
+
+
+# drf-yasg documentation objects, built once at import and shared by the decorators
+STATUS_QUERY_PARAM = openapi.Parameter(
+    'status', 
+    openapi.IN_QUERY, 
+    description="Task status (pending, in_progress, completed)", 
+    type=openapi.TYPE_STRING
+)
+ADD_TASKS_BODY = openapi.Schema(
+    type=openapi.TYPE_OBJECT,
+    required=['task_ids'],
+    properties={
+        'task_ids': openapi.Schema(
+            type=openapi.TYPE_ARRAY,
+            items=openapi.Schema(type=openapi.TYPE_INTEGER)
+        )
+    }
+)
 
 
 class TaskViewSet(viewsets.ModelViewSet):
@@ -15,17 +61,29 @@ class TaskViewSet(viewsets.ModelViewSet):
     queryset = Task.objects.all()
     serializer_class = TaskSerializer
     
+    def get_serializer_class(self):
+        """Return the read-only serializer for actions that only render tasks."""
+        if self.action in ('list', 'retrieve', 'by_status'):
+            return TaskReadSerializer
+        return TaskSerializer
+    
+    @method_decorator(condition(etag_func=task_list_etag))
+    def list(self, request, *args, **kwargs):
+        """List tasks, rendering each page with the static serializer.
+        
+        A request whose If-None-Match still matches gets a 304 after only the
+        task_list_etag aggregate, without the page being queried or rendered.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(StaticTaskSerializer(page, many=True).data)
+        return Response(StaticTaskSerializer(queryset, many=True).data)
+    
     @swagger_auto_schema(
         method='get',
         operation_description="Filter tasks by status",
-        manual_parameters=[
-            openapi.Parameter(
-                'status', 
-                openapi.IN_QUERY, 
-                description="Task status (pending, in_progress, completed)", 
-                type=openapi.TYPE_STRING
-            )
-        ]
+        manual_parameters=[STATUS_QUERY_PARAM]
     )
     @action(detail=False, methods=['get'])
     def by_status(self, request):
@@ -36,10 +94,28 @@ class TaskViewSet(viewsets.ModelViewSet):
                 {"error": "Status parameter is required."}, 
                 status=status.HTTP_400_BAD_REQUEST
             )
+        if status_param not in VALID_STATUSES:
+            return Response(
+                {"error": f"Invalid status. Expected one of: {', '.join(sorted(VALID_STATUSES))}."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
         
-        tasks = self.queryset.filter(status=status_param)
-        serializer = self.serializer_class(tasks, many=True)
-        return Response(serializer.data)
+        # Results are cached until a task is saved or deleted; see signals.py
+        cache_key = BY_STATUS_CACHE_KEYS[status_param]
+        data = cache.get(cache_key)
+        if data is None:
+            # Rows as plain dicts: no Task instances or serializer fields are built,
+            # and the renderer formats the dates the way TaskReadSerializer does
+            tasks = self.get_queryset().filter(status=status_param)
+            data = list(tasks.values(*TaskReadSerializer.Meta.fields))
+            cache.set(cache_key, data, BY_STATUS_CACHE_TIMEOUT)
+        
+        # Paginate the (cached) list, so every response carries a single page
+        # and its links are built for this request
+        page = self.paginate_queryset(data)
+        if page is not None:
+            return self.get_paginated_response(page)
+        return Response(data)
 
 
 class CategoryViewSet(viewsets.ModelViewSet):
@@ -49,8 +125,28 @@ class CategoryViewSet(viewsets.ModelViewSet):
     queryset = Category.objects.all()
     serializer_class = CategorySerializer
     
+    def get_queryset(self):
+        """Prefetch the tasks nested by the detail serializer; load only what add_tasks uses."""
+        queryset = super().get_queryset()
+        if self.action == 'retrieve':
+            # One extra query for all of the category's tasks instead of one per task,
+            # selecting just the columns the nested serializer renders, in its order
+            queryset = queryset.prefetch_related(Prefetch(
+                'tasks',
+                queryset=Task.objects.only(*TaskSerializer.Meta.fields).order_by('-created_at'),
+            ))
+        elif self.action == 'add_tasks':
+            # Only the primary key is needed to add to the relation
+            queryset = queryset.only('id')
+        return queryset
+    
     def get_serializer_class(self):
-        """Return appropriate serializer class."""
+        """Return appropriate serializer class.
+        
+        Only retrieve renders tasks, and get_queryset prefetches them for it.
+        Any other action given a tasks-rendering serializer needs the same
+        prefetch, or it costs one query per category listed.
+        """
         if self.action == 'retrieve':
             return CategoryDetailSerializer
         return CategorySerializer
@@ -58,39 +154,39 @@ class CategoryViewSet(viewsets.ModelViewSet):
     @swagger_auto_schema(
         method='post',
         operation_description="Add tasks to a category",
-        request_body=openapi.Schema(
-            type=openapi.TYPE_OBJECT,
-            required=['task_ids'],
-            properties={
-                'task_ids': openapi.Schema(
-                    type=openapi.TYPE_ARRAY,
-                    items=openapi.Schema(type=openapi.TYPE_INTEGER)
-                )
-            }
-        )
+        request_body=ADD_TASKS_BODY
     )
     @action(detail=True, methods=['post'])
     def add_tasks(self, request, pk=None):
         """Add tasks to a category."""
-        try:
-            category = self.get_object()
-            task_ids = request.data.get('task_ids', [])
-            
-            if not task_ids:
-                return Response(
-                    {"error": "task_ids parameter is required."}, 
-                    status=status.HTTP_400_BAD_REQUEST
-                )
-            
-            tasks = Task.objects.filter(id__in=task_ids)
-            category.tasks.add(*tasks)
-            
+        # A missing category raises Http404, which DRF answers with a 404
+        category = self.get_object()
+        task_ids = request.data.get('task_ids') if isinstance(request.data, dict) else None
+        
+        if not task_ids:
             return Response(
-                {"message": f"Added {tasks.count()} tasks to category."},
-                status=status.HTTP_200_OK
+                {"error": "task_ids parameter is required."}, 
+                status=status.HTTP_400_BAD_REQUEST
             )
-        except Exception as e:
+        if not isinstance(task_ids, list) or not all(type(task_id) is int for task_id in task_ids):
             return Response(
-                {"error": str(e)}, 
+                {"error": "task_ids must be a list of integers."},
                 status=status.HTTP_400_BAD_REQUEST
-            ) 
\ No newline at end of file
+            )
+        
+        # The ids of the tasks that exist, read once for both the insert and the count
+        found_ids = list(Task.objects.filter(id__in=task_ids).values_list('id', flat=True))
+        
+        # One multi-row INSERT into the through table; links that already
+        # exist are skipped by the database instead of being queried first
+        through = Category.tasks.through
+        through.objects.bulk_create(
+            [through(category_id=category.pk, task_id=task_id) for task_id in found_ids],
+            ignore_conflicts=True,
+            batch_size=1000,
+        )
+        
+        return Response(
+            {"message": f"Added {len(found_ids)} tasks to category."},
+            status=status.HTTP_200_OK
+        )
@@ -1,6 +1,8 @@
-from flask import Flask, request, jsonify
+from flask import Flask, request
 from flask_cors import CORS
+import itertools
 import os
+import orjson
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -10,9 +12,13 @@ load_dotenv()
 app = Flask(__name__)
 CORS(app, resources={r"/api/*": {"origins": ["http://localhost:8085"]}})  # Enable CORS for specific origin
 
-# Sample in-memory database
-users = []
-user_id_counter = 1
+def jsonify(obj):
+    """Serialize *obj* with orjson straight to bytes (drop-in for flask.jsonify)."""
+    return app.response_class(orjson.dumps(obj), mimetype="application/json")
+
+# Sample in-memory database, keyed by user id
+users = {}
+_next_id = itertools.count(1).__next__
 
 # Root endpoint
 @app.route('/')
@@ -22,12 +28,12 @@ def home():
 # Get all users
 @app.route('/api/users', methods=['GET'])
 def get_users():
-    return jsonify(users), 200
+    return jsonify(list(users.values())), 200
 
 # Get a specific user
 @app.route('/api/users/<int:user_id>', methods=['GET'])
 def get_user(user_id):
-    user = next((user for user in users if user['id'] == user_id), None)
+    user = users.get(user_id)
     if user:
         return jsonify(user), 200
     return jsonify({"error": "User not found"}), 404
@@ -35,27 +41,25 @@ def get_user(user_id):
 # Create a new user
 @app.route('/api/users', methods=['POST'])
 def create_user():
-    global user_id_counter
     data = request.get_json()
     
     if not data or 'name' not in data or 'email' not in data:
         return jsonify({"error": "Name and email are required"}), 400
     
     new_user = {
-        "id": user_id_counter,
+        "id": _next_id(),
         "name": data['name'],
         "email": data['email']
     }
     
-    users.append(new_user)
-    user_id_counter += 1
+    users[new_user['id']] = new_user
     
     return jsonify(new_user), 201
 
 # Update a user
 @app.route('/api/users/<int:user_id>', methods=['PUT'])
 def update_user(user_id):
-    user = next((user for user in users if user['id'] == user_id), None)
+    user = users.get(user_id)
     if not user:
         return jsonify({"error": "User not found"}), 404
     
@@ -70,12 +74,9 @@ def update_user(user_id):
 # Delete a user
 @app.route('/api/users/<int:user_id>', methods=['DELETE'])
 def delete_user(user_id):
-    global users
-    user = next((user for user in users if user['id'] == user_id), None)
-    if not user:
+    if users.pop(user_id, None) is None:
         return jsonify({"error": "User not found"}), 404
     
-    users = [user for user in users if user['id'] != user_id]
     return jsonify({"message": "User deleted successfully"}), 200
 
 if __name__ == '__main__':